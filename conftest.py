@@ -80,6 +80,9 @@ def config(isolated_dir: Path) -> Config:
         fuse_artists_blacklist=None,
         fuse_genres_blacklist=None,
         fuse_labels_blacklist=None,
+        fuse_entry_timeout=30,
+        fuse_attr_timeout=300,
+        fuse_workers=2,
         cover_art_stems=["cover", "folder", "art", "front"],
         valid_art_exts=["jpg", "jpeg", "png"],
         ignore_release_directories=[],
@@ -25,6 +25,7 @@ the overall complexity of the cache update sequence:
 
 import contextlib
 import copy
+import functools
 import hashlib
 import json
 import logging
@@ -2166,6 +2167,38 @@ def cover_exists(c: Config, release_virtual_dirname: str, cover_name: str) -> Pa
         return None
 
 
+def resolve_release_child(
+    c: Config,
+    release_virtual_dirname: str,
+    filename: str,
+) -> Path | None:
+    """
+    Resolve a file in a release directory to its source path in a single query. Tracks take
+    precedence over the cover art, matching `track_exists` followed by `cover_exists`.
+    """
+    with connect(c) as conn:
+        cursor = conn.execute(
+            """
+            SELECT 1 AS priority, t.source_path AS path
+            FROM tracks t
+            JOIN releases r ON t.release_id = r.id
+            WHERE r.virtual_dirname = ? AND t.virtual_filename = ?
+            UNION ALL
+            SELECT 2 AS priority, r.cover_image_path AS path
+            FROM releases r
+            WHERE r.virtual_dirname = ? AND r.cover_image_path IS NOT NULL
+            ORDER BY priority
+            """,
+            (release_virtual_dirname, filename, release_virtual_dirname),
+        )
+        for row in cursor:
+            p = Path(row["path"])
+            # The cover art is matched on its basename, which we can't compare in SQL.
+            if row["priority"] == 1 or p.name == filename:
+                return p
+        return None
+
+
 def artist_exists(c: Config, artist_sanitized: str) -> bool:
     with connect(c) as conn:
         cursor = conn.execute(
@@ -2214,6 +2247,8 @@ def playlist_exists(c: Config, name: str) -> bool:
 ILLEGAL_FS_CHARS_REGEX = re.compile(r'[:\?<>\\*\|"\/]+')
 
 
+# Artist, genre, and label names repeat across many releases in a cache update, so memoize.
+@functools.lru_cache(maxsize=8192)
 def _sanitize_filename(x: str) -> str:
     return ILLEGAL_FS_CHARS_REGEX.sub("_", x)
 
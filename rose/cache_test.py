@@ -40,6 +40,7 @@ from rose.cache import (
     migrate_database,
     playlist_exists,
     release_exists,
+    resolve_release_child,
     track_exists,
     update_cache,
     update_cache_evict_nonexistent_releases,
@@ -1279,6 +1280,21 @@ def test_cover_exists(config: Config) -> None:
     assert not cover_exists(config, "r1", "cover.jpg")
 
 
+@pytest.mark.usefixtures("seeded_cache")
+def test_resolve_release_child(config: Config) -> None:
+    assert (
+        resolve_release_child(config, "r1", "01.m4a") == config.music_source_dir / "r1" / "01.m4a"
+    )
+    assert (
+        resolve_release_child(config, "r2", "cover.jpg")
+        == config.music_source_dir / "r2" / "cover.jpg"
+    )
+    assert not resolve_release_child(config, "r2", "cover.png")
+    assert not resolve_release_child(config, "r1", "cover.jpg")
+    assert not resolve_release_child(config, "r1", "lalala")
+    assert not resolve_release_child(config, "lalala", "01.m4a")
+
+
 @pytest.mark.usefixtures("seeded_cache")
 def test_artist_exists(config: Config) -> None:
     assert artist_exists(config, "Bass Man")
@@ -424,11 +424,12 @@ def parse_release_from_potential_path(c: Config, r: str) -> str:
     if not p.is_dir():
         return r
     # And also exit if it's not in the virtual filesystem lol.
-    if not str(p).startswith(str(c.fuse_mount_dir)):
+    if not p.is_relative_to(c.fuse_mount_dir):
         return r
 
-    # Parse the virtual path with the standard function.
-    vpath = VirtualPath.parse(Path(str(p).removeprefix(str(c.fuse_mount_dir))))
+    # Parse the virtual path with the standard function. The parser is purely lexical (it does not
+    # resolve the path against the filesystem), so hand it the absolute path within the mount.
+    vpath = VirtualPath.parse(Path("/") / p.relative_to(c.fuse_mount_dir))
     # If there is no release, or there is a file, abort lol.
     if not vpath.release or vpath.file:
         return r
@@ -23,6 +23,9 @@ def test_parse_release_from_path(config: Config) -> None:
         # Non-release directory is no-opped.
         path = str(config.fuse_mount_dir / "1. Releases")
         assert parse_release_from_potential_path(config, path) == path
+        # The mount directory itself is no-opped.
+        path = str(config.fuse_mount_dir)
+        assert parse_release_from_potential_path(config, path) == path
         # File is no-opped.
         path = str(config.fuse_mount_dir / "1. Releases" / "r1" / "01.m4a")
         assert parse_release_from_potential_path(config, path) == path
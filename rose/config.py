@@ -60,6 +60,12 @@ class Config:
     fuse_artists_blacklist: list[str] | None
     fuse_genres_blacklist: list[str] | None
     fuse_labels_blacklist: list[str] | None
+    # How long, in seconds, the kernel may cache the lookups and attributes of virtual filesystem
+    # entries before asking Rose again.
+    fuse_entry_timeout: int
+    fuse_attr_timeout: int
+    # The number of worker threads that handle virtual filesystem requests.
+    fuse_workers: int
 
     cover_art_stems: list[str]
     valid_art_exts: list[str]
@@ -270,6 +276,40 @@ class Config:
                 f"configuration file ({cfgpath}): must specify only one or the other"
             )
 
+        try:
+            fuse_entry_timeout = int(data.get("fuse_entry_timeout", 30))
+            if fuse_entry_timeout < 0:
+                raise ValueError(
+                    f"fuse_entry_timeout must be a non-negative integer: got {fuse_entry_timeout}"
+                )
+        except (ValueError, TypeError) as e:
+            raise InvalidConfigValueError(
+                f"Invalid value for fuse_entry_timeout in configuration file ({cfgpath}): "
+                "must be a non-negative integer"
+            ) from e
+
+        try:
+            fuse_attr_timeout = int(data.get("fuse_attr_timeout", 300))
+            if fuse_attr_timeout < 0:
+                raise ValueError(
+                    f"fuse_attr_timeout must be a non-negative integer: got {fuse_attr_timeout}"
+                )
+        except (ValueError, TypeError) as e:
+            raise InvalidConfigValueError(
+                f"Invalid value for fuse_attr_timeout in configuration file ({cfgpath}): "
+                "must be a non-negative integer"
+            ) from e
+
+        try:
+            fuse_workers = int(data.get("fuse_workers", min(4, max_proc)))
+            if fuse_workers <= 0:
+                raise ValueError(f"fuse_workers must be a positive integer: got {fuse_workers}")
+        except (ValueError, TypeError) as e:
+            raise InvalidConfigValueError(
+                f"Invalid value for fuse_workers in configuration file ({cfgpath}): "
+                "must be a positive integer"
+            ) from e
+
         try:
             cover_art_stems = data.get("cover_art_stems", ["folder", "cover", "art", "front"])
             if not isinstance(cover_art_stems, list):
@@ -341,6 +381,9 @@ class Config:
             fuse_artists_blacklist=fuse_artists_blacklist,
             fuse_genres_blacklist=fuse_genres_blacklist,
             fuse_labels_blacklist=fuse_labels_blacklist,
+            fuse_entry_timeout=fuse_entry_timeout,
+            fuse_attr_timeout=fuse_attr_timeout,
+            fuse_workers=fuse_workers,
             cover_art_stems=cover_art_stems,
             valid_art_exts=valid_art_exts,
             ignore_release_directories=ignore_release_directories,
@@ -348,8 +391,10 @@ class Config:
         )
 
     @functools.cached_property
-    def valid_cover_arts(self) -> list[str]:
-        return [s + "." + e for s in self.cover_art_stems for e in self.valid_art_exts]
+    def valid_cover_arts(self) -> frozenset[str]:
+        # Only ever used for membership checks (e.g. on every file in a release during a cache
+        # update), so store it as a set.
+        return frozenset(s + "." + e for s in self.cover_art_stems for e in self.valid_art_exts)
 
     @functools.cached_property
     def cache_database_path(self) -> Path:
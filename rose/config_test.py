@@ -41,6 +41,9 @@ def test_config_full() -> None:
                 fuse_artists_blacklist = [ "xxx" ]
                 fuse_genres_blacklist = [ "yyy" ]
                 fuse_labels_blacklist = [ "zzz" ]
+                fuse_entry_timeout = 60
+                fuse_attr_timeout = 120
+                fuse_workers = 3
                 cover_art_stems = [ "aa", "bb" ]
                 valid_art_exts = [ "tiff" ]
                 ignore_release_directories = [ "dummy boy" ]
@@ -80,6 +83,9 @@ def test_config_full() -> None:
             fuse_artists_blacklist=["xxx"],
             fuse_genres_blacklist=["yyy"],
             fuse_labels_blacklist=["zzz"],
+            fuse_entry_timeout=60,
+            fuse_attr_timeout=120,
+            fuse_workers=3,
             cover_art_stems=["aa", "bb"],
             valid_art_exts=["tiff"],
             ignore_release_directories=["dummy boy"],
@@ -350,6 +356,54 @@ def test_config_value_validation() -> None:
             == f"Cannot specify both fuse_labels_whitelist and fuse_labels_blacklist in configuration file ({path}): must specify only one or the other"  # noqa: E501
         )
 
+        # fuse_entry_timeout
+        write(config + '\nfuse_entry_timeout = "lalala"')
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_entry_timeout in configuration file ({path}): must be a non-negative integer"  # noqa
+        )
+        write(config + "\nfuse_entry_timeout = -1")
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_entry_timeout in configuration file ({path}): must be a non-negative integer"  # noqa
+        )
+
+        # fuse_attr_timeout
+        write(config + '\nfuse_attr_timeout = "lalala"')
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_attr_timeout in configuration file ({path}): must be a non-negative integer"  # noqa
+        )
+        write(config + "\nfuse_attr_timeout = -1")
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_attr_timeout in configuration file ({path}): must be a non-negative integer"  # noqa
+        )
+
+        # fuse_workers
+        write(config + '\nfuse_workers = "lalala"')
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_workers in configuration file ({path}): must be a positive integer"  # noqa
+        )
+        write(config + "\nfuse_workers = 0")
+        with pytest.raises(InvalidConfigValueError) as excinfo:
+            Config.parse(config_path_override=path)
+        assert (
+            str(excinfo.value)
+            == f"Invalid value for fuse_workers in configuration file ({path}): must be a positive integer"  # noqa
+        )
+
         # cover_art_stems
         write(config + '\ncover_art_stems = "lalala"')
         with pytest.raises(InvalidConfigValueError) as excinfo:
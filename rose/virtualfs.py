@@ -13,7 +13,7 @@ Since this is a pretty hefty module, we'll cover the organization. This module c
    parameters.
 
 3. FileHandleGenerator: A class that keeps generates new file handles. It is a counter that wraps
-   back to 4 when the file handles exceed ~10k, as to avoid any overflows.
+   back to 10 when the file handles exceed ~10k, as to avoid any overflows.
 
 4. RoseLogicalFS: A logical representation of Rose's filesystem logic, freed from the annoying
    implementation details that a low-level library like `llfuse` comes with.
@@ -29,28 +29,35 @@ Since this is a pretty hefty module, we'll cover the organization. This module c
 
 from __future__ import annotations
 
+import array
 import contextlib
+import ctypes
 import errno
+import hashlib
+import io
 import logging
 import os
-import random
 import re
 import stat
 import subprocess
+import sys
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
 import cachetools
 import llfuse
 
 from rose.audiotags import SUPPORTED_AUDIO_EXTENSIONS, AudioTags
 from rose.cache import (
+    CachedPlaylist,
+    CachedRelease,
+    CachedTrack,
     artist_exists,
     collage_exists,
-    cover_exists,
     genre_exists,
     get_playlist,
     get_release,
@@ -64,7 +71,7 @@ from rose.cache import (
     list_playlists,
     list_releases,
     release_exists,
-    track_exists,
+    resolve_release_child,
     update_cache_for_releases,
 )
 from rose.collages import (
@@ -103,179 +110,206 @@ POSITION_REGEX = re.compile(r"^([^.]+)\. ")
 # strip it out.
 ADDED_AT_REGEX = re.compile(r"^\[[\d-]{10}\] ")
 
+VirtualView = Literal[
+    "Root",
+    "Releases",
+    "Artists",
+    "Genres",
+    "Labels",
+    "Collages",
+    "Playlists",
+    "New",
+    "Recently Added",
+]
+
+# The top-level directories of the virtual filesystem, mapped to the view that they render.
+VIEW_DIRNAMES: dict[str, VirtualView] = {
+    "1. Releases": "Releases",
+    "2. Releases - New": "New",
+    "3. Releases - Recently Added": "Recently Added",
+    "4. Artists": "Artists",
+    "5. Genres": "Genres",
+    "6. Labels": "Labels",
+    "7. Collages": "Collages",
+    "8. Playlists": "Playlists",
+}
+# Parse a path into its top-level view and up to three trailing segments in one pass. Paths that
+# nest deeper than any view supports do not match at all.
+PATH_REGEX = re.compile(
+    "/(?P<view>"
+    + "|".join(re.escape(x) for x in VIEW_DIRNAMES)
+    + ")(?:/(?P<seg1>[^/]+)(?:/(?P<seg2>[^/]+)(?:/(?P<seg3>[^/]+))?)?)?"
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class VirtualPath:
-    view: (
-        Literal[
-            "Root",
-            "Releases",
-            "Artists",
-            "Genres",
-            "Labels",
-            "Collages",
-            "Playlists",
-            "New",
-            "Recently Added",
-        ]
-        | None
-    )
+    view: VirtualView | None
     artist: str | None = None
     genre: str | None = None
     label: str | None = None
     collage: str | None = None
     playlist: str | None = None
     release: str | None = None
-    release_position: str | None = None
+    release_position: int | None = None
     file: str | None = None
-    file_position: str | None = None
+    file_position: int | None = None
 
     @classmethod
-    def parse(cls, path: Path, *, parse_release_position: bool = True) -> VirtualPath:
-        parts = str(path.resolve()).split("/")[1:]  # First part is always empty string.
+    def parse(cls, path: Path | str, *, parse_release_position: bool = True) -> VirtualPath:
+        # Every FUSE syscall parses its path, and the same handful of paths are parsed over and over
+        # during a directory walk. Parsing is purely lexical, so the result for a given path string
+        # never changes and we can share the (immutable) result across calls.
+        key = (str(path), parse_release_position)
+        if (vpath := PARSE_CACHE.get(key)) is None:
+            vpath = PARSE_CACHE[key] = cls._parse(*key)
+        return vpath
 
-        if len(parts) == 1 and parts[0] == "":
+    @classmethod
+    def _parse(cls, spath: str, parse_release_position: bool) -> VirtualPath:
+        if spath == "/":
             return cls(view="Root")
 
-        if parts[0] == "1. Releases":
-            if len(parts) == 1:
-                return cls(view="Releases")
-            if len(parts) == 2:
-                return cls(view="Releases", release=parts[1])
-            if len(parts) == 3:
-                return cls(
-                    view="Releases",
-                    release=parts[1],
-                    file=POSITION_REGEX.sub("", parts[2]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[2])) else None,
-                )
+        # Match the whole path in a single pass. The regex constrains the path to a known top-level
+        # view with at most three trailing segments; the per-view parsers check their depth limits.
+        m = PATH_REGEX.fullmatch(spath)
+        if not m:
             raise llfuse.FUSEError(errno.ENOENT)
-
-        if parts[0] == "2. Releases - New":
-            if len(parts) == 1:
-                return cls(view="New")
-            if len(parts) == 2:
-                return cls(view="New", release=parts[1])
-            if len(parts) == 3:
-                return cls(
-                    view="New",
-                    release=parts[1],
-                    file=POSITION_REGEX.sub("", parts[2]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[2])) else None,
-                )
+        view = VIEW_DIRNAMES[m["view"]]
+        seg1, seg2, seg3 = m.group("seg1", "seg2", "seg3")
+        # Intern the entity names, since they are used as keys into the release indexes and
+        # existence caches. Lookups with an interned key can then match on identity.
+        seg1 = _intern(seg1)
+        return _VIEW_PARSERS[view](view, seg1, seg2, seg3, parse_release_position)
+
+
+# Each view parses its trailing path segments into a VirtualPath. VirtualPath._parse dispatches to
+# these through _VIEW_PARSERS.
+
+
+def _parse_releases_view(
+    view: VirtualView,
+    seg1: str | None,
+    seg2: str | None,
+    seg3: str | None,
+    parse_release_position: bool,  # noqa: ARG001
+) -> VirtualPath:
+    if seg3 is not None:
+        raise llfuse.FUSEError(errno.ENOENT)
+    release = seg1
+    if view == "Recently Added" and seg1 is not None:
+        release = _intern(_strip_added_at(seg1))
+        if release is None:
             raise llfuse.FUSEError(errno.ENOENT)
+    file, file_position = _split_position(seg2)
+    return VirtualPath(view=view, release=release, file=file, file_position=file_position)
+
+
+def _parse_entity_view(
+    view: VirtualView,
+    seg1: str | None,
+    seg2: str | None,
+    seg3: str | None,
+    parse_release_position: bool,  # noqa: ARG001
+) -> VirtualPath:
+    file, file_position = _split_position(seg3)
+    return VirtualPath(
+        view=view,
+        artist=seg1 if view == "Artists" else None,
+        genre=seg1 if view == "Genres" else None,
+        label=seg1 if view == "Labels" else None,
+        release=_intern(seg2),
+        file=file,
+        file_position=file_position,
+    )
 
-        if parts[0] == "3. Releases - Recently Added":
-            if len(parts) == 1:
-                return cls(view="Recently Added")
-            if len(parts) == 2 and ADDED_AT_REGEX.match(parts[1]):
-                return cls(view="Recently Added", release=ADDED_AT_REGEX.sub("", parts[1]))
-            if len(parts) == 3 and ADDED_AT_REGEX.match(parts[1]):
-                return cls(
-                    view="Recently Added",
-                    release=ADDED_AT_REGEX.sub("", parts[1]),
-                    file=POSITION_REGEX.sub("", parts[2]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[2])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
 
-        if parts[0] == "4. Artists":
-            if len(parts) == 1:
-                return cls(view="Artists")
-            if len(parts) == 2:
-                return cls(view="Artists", artist=parts[1])
-            if len(parts) == 3:
-                return cls(view="Artists", artist=parts[1], release=parts[2])
-            if len(parts) == 4:
-                return cls(
-                    view="Artists",
-                    artist=parts[1],
-                    release=parts[2],
-                    file=POSITION_REGEX.sub("", parts[3]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[3])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
+def _parse_collages_view(
+    view: VirtualView,
+    seg1: str | None,
+    seg2: str | None,
+    seg3: str | None,
+    parse_release_position: bool,
+) -> VirtualPath:
+    release, release_position = seg2, None
+    if parse_release_position:
+        release, release_position = _split_position(seg2)
+    release = _intern(release)
+    file, file_position = _split_position(seg3)
+    return VirtualPath(
+        view=view,
+        collage=seg1,
+        release=release,
+        release_position=release_position,
+        file=file,
+        file_position=file_position,
+    )
 
-        if parts[0] == "5. Genres":
-            if len(parts) == 1:
-                return cls(view="Genres")
-            if len(parts) == 2:
-                return cls(view="Genres", genre=parts[1])
-            if len(parts) == 3:
-                return cls(view="Genres", genre=parts[1], release=parts[2])
-            if len(parts) == 4:
-                return cls(
-                    view="Genres",
-                    genre=parts[1],
-                    release=parts[2],
-                    file=POSITION_REGEX.sub("", parts[3]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[3])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
 
-        if parts[0] == "6. Labels":
-            if len(parts) == 1:
-                return cls(view="Labels")
-            if len(parts) == 2:
-                return cls(view="Labels", label=parts[1])
-            if len(parts) == 3:
-                return cls(view="Labels", label=parts[1], release=parts[2])
-            if len(parts) == 4:
-                return cls(
-                    view="Labels",
-                    label=parts[1],
-                    release=parts[2],
-                    file=POSITION_REGEX.sub("", parts[3]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[3])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
+def _parse_playlists_view(
+    view: VirtualView,
+    seg1: str | None,
+    seg2: str | None,
+    seg3: str | None,
+    parse_release_position: bool,  # noqa: ARG001
+) -> VirtualPath:
+    if seg3 is not None:
+        raise llfuse.FUSEError(errno.ENOENT)
+    file, file_position = _split_position(seg2)
+    return VirtualPath(view=view, playlist=seg1, file=file, file_position=file_position)
+
+
+_VIEW_PARSERS: dict[
+    VirtualView,
+    Callable[[VirtualView, str | None, str | None, str | None, bool], VirtualPath],
+] = {
+    "Releases": _parse_releases_view,
+    "New": _parse_releases_view,
+    "Recently Added": _parse_releases_view,
+    "Artists": _parse_entity_view,
+    "Genres": _parse_entity_view,
+    "Labels": _parse_entity_view,
+    "Collages": _parse_collages_view,
+    "Playlists": _parse_playlists_view,
+}
+
+# Sized so that the paths of a `find`/`ls -R` burst over a large library (tens of thousands of
+# releases and tracks, each looked up and then stat-ed) stay resident until the burst finishes.
+PARSE_CACHE: cachetools.LRUCache[tuple[str, bool], VirtualPath] = cachetools.LRUCache(
+    maxsize=1 << 16
+)
 
-        if parts[0] == "7. Collages":
-            if len(parts) == 1:
-                return cls(view="Collages")
-            if len(parts) == 2:
-                return cls(view="Collages", collage=parts[1])
-            if len(parts) == 3:
-                return cls(
-                    view="Collages",
-                    collage=parts[1],
-                    release=POSITION_REGEX.sub("", parts[2])
-                    if parse_release_position
-                    else parts[2],
-                    release_position=m[1]
-                    if parse_release_position and (m := POSITION_REGEX.match(parts[2]))
-                    else None,
-                )
-            if len(parts) == 4:
-                return cls(
-                    view="Collages",
-                    collage=parts[1],
-                    release=POSITION_REGEX.sub("", parts[2])
-                    if parse_release_position
-                    else parts[2],
-                    release_position=m[1]
-                    if parse_release_position and (m := POSITION_REGEX.match(parts[2]))
-                    else None,
-                    file=POSITION_REGEX.sub("", parts[3]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[3])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
 
-        if parts[0] == "8. Playlists":
-            if len(parts) == 1:
-                return cls(view="Playlists")
-            if len(parts) == 2:
-                return cls(view="Playlists", playlist=parts[1])
-            if len(parts) == 3:
-                return cls(
-                    view="Playlists",
-                    playlist=parts[1],
-                    file=POSITION_REGEX.sub("", parts[2]),
-                    file_position=m[1] if (m := POSITION_REGEX.match(parts[2])) else None,
-                )
-            raise llfuse.FUSEError(errno.ENOENT)
+def _split_position(x: str | None) -> tuple[str | None, int | None]:
+    """
+    Split a `{position}. {name}` path segment into `(name, position)` with a single match. The
+    prefix is stripped even when it is not a number, in which case the position is None.
+    """
+    if x is None:
+        return None, None
+    if m := POSITION_REGEX.match(x):
+        return x[m.end() :], int(m[1]) if m[1].isdecimal() else None
+    return x, None
 
-        raise llfuse.FUSEError(errno.ENOENT)
+
+def _intern(x: str | None) -> str | None:
+    return sys.intern(x) if x is not None else None
+
+
+def _name_variants(name: str) -> tuple[str, ...]:
+    """
+    The forms that a path segment can take after parsing. A looked-up name can only resolve to a
+    listed entry if the two share a variant.
+    """
+    stripped, _ = _split_position(name)
+    return name, stripped or name, _strip_added_at(name) or name
+
+
+def _strip_added_at(x: str) -> str | None:
+    """Strip the `[{added_at}] ` prefix from a segment; return None if the segment lacks one."""
+    if m := ADDED_AT_REGEX.match(x):
+        return x[m.end() :]
+    return None
 
 
 class CanShower:
@@ -286,46 +320,24 @@ class CanShower:
 
     def __init__(self, config: Config):
         self._config = config
-        self._artist_w = None
-        self._artist_b = None
-        self._genre_w = None
-        self._genre_b = None
-        self._label_w = None
-        self._label_b = None
-
-        if config.fuse_artists_whitelist:
-            self._artist_w = set(config.fuse_artists_whitelist)
-        if config.fuse_artists_blacklist:
-            self._artist_b = set(config.fuse_artists_blacklist)
-        if config.fuse_genres_whitelist:
-            self._genre_w = set(config.fuse_genres_whitelist)
-        if config.fuse_genres_blacklist:
-            self._genre_b = set(config.fuse_genres_blacklist)
-        if config.fuse_labels_whitelist:
-            self._label_w = set(config.fuse_labels_whitelist)
-        if config.fuse_labels_blacklist:
-            self._label_b = set(config.fuse_labels_blacklist)
-
-    def artist(self, artist: str) -> bool:
-        if self._artist_w:
-            return artist in self._artist_w
-        elif self._artist_b:
-            return artist not in self._artist_b
-        return True
-
-    def genre(self, genre: str) -> bool:
-        if self._genre_w:
-            return genre in self._genre_w
-        elif self._genre_b:
-            return genre not in self._genre_b
-        return True
-
-    def label(self, label: str) -> bool:
-        if self._label_w:
-            return label in self._label_w
-        elif self._label_b:
-            return label not in self._label_b
-        return True
+        # The whitelists and blacklists are fixed for the lifetime of the filesystem, so we resolve
+        # each pair into a single predicate up front rather than re-checking which list is set on
+        # every call.
+        self.artist = _make_can_show(config.fuse_artists_whitelist, config.fuse_artists_blacklist)
+        self.genre = _make_can_show(config.fuse_genres_whitelist, config.fuse_genres_blacklist)
+        self.label = _make_can_show(config.fuse_labels_whitelist, config.fuse_labels_blacklist)
+
+
+def _make_can_show(
+    whitelist: list[str] | None,
+    blacklist: list[str] | None,
+) -> Callable[[str], bool]:
+    if whitelist:
+        return frozenset(whitelist).__contains__
+    if blacklist:
+        b = frozenset(blacklist)
+        return lambda x: x not in b
+    return lambda _: True
 
 
 class UnknownFileHandleError(RoseError):
@@ -335,15 +347,19 @@ class UnknownFileHandleError(RoseError):
 class FileHandleManager:
     """
     FileDescriptorGenerator generates file descriptors and handles wrapping so that we do not go
-    over the int size. Assumes that we do not cycle 10k file descriptors before the first descriptor
-    is released.
+    over the int size. Handles are live from when they are handed out until they are released, and
+    the counter skips live handles when it wraps around.
     """
 
+    # Fake sentinel for file handler. The VirtualFS class implements this file handle as a black
+    # hole.
+    dev_null: Final[int] = 9
+
+    # These are consulted on every FUSE call; slots make their attribute accesses cheaper.
+    __slots__ = ("_state", "_rose_to_host_map")
+
     def __init__(self) -> None:
         self._state = 10
-        # Fake sentinel for file handler. The VirtualFS class implements this file handle as a black
-        # hole.
-        self.dev_null = 9
         # We translate Rose's Virtual Filesystem file handles to the host machine file handles. This
         # means that every file handle from the host system has a corresponding "wrapper" file
         # handle in Rose, and we only return Rose's file handles from the virtual fs.
@@ -353,40 +369,109 @@ class FileHandleManager:
         #
         # This prevents any accidental collisions, where Rose generates a file handle that ends up
         # being the same number as a file handle that the host system generates.
-        self._rose_to_host_map: dict[int, int] = {}
+        #
+        # Since Rose's file handles are bounded to [10, 10_000), the map is a flat array indexed by
+        # Rose file handle. It also tracks which handles are live: -1 marks a free slot, and -2
+        # marks a live handle that does not wrap a host file handle (e.g. a directory handle).
+        self._rose_to_host_map = array.array("i", [-1] * 10_000)
 
     def next(self) -> int:
-        self._state = max(10, self._state + 1 % 10_000)
-        return self._state
+        """
+        Hand out a free Rose file handle, which stays live until it is released. The counter wraps,
+        so skip the handles that are still live. If every handle is live, fail with EMFILE.
+        """
+        for _ in range(10_000 - 10):
+            s = self._state + 1
+            if s >= 10_000:
+                s = 10
+            self._state = s
+            if self._rose_to_host_map[s] == -1:
+                self._rose_to_host_map[s] = -2
+                return s
+        raise llfuse.FUSEError(errno.EMFILE)
+
+    def release(self, rose_fh: int) -> None:
+        """Free a Rose file handle that does not wrap a host file handle for reuse."""
+        self._rose_to_host_map[rose_fh] = -1
 
     def wrap_host(self, host_fh: int) -> int:
-        rose_fh = self.next()
+        """Wrap a host file handle in a Rose file handle. Close the host file handle on failure."""
+        try:
+            rose_fh = self.next()
+        except llfuse.FUSEError:
+            os.close(host_fh)
+            raise
         self._rose_to_host_map[rose_fh] = host_fh
         return rose_fh
 
     def unwrap_host(self, rose_fh: int) -> int:
         try:
-            return self._rose_to_host_map[rose_fh]
-        except KeyError as e:
+            host_fh = self._rose_to_host_map[rose_fh]
+        except IndexError as e:
             raise llfuse.FUSEError(errno.EBADF) from e
+        if host_fh < 0:
+            raise llfuse.FUSEError(errno.EBADF)
+        return host_fh
+
+    def release_host(self, rose_fh: int) -> int:
+        """Unwrap the host file handle and free the Rose file handle's slot for reuse."""
+        host_fh = self.unwrap_host(rose_fh)
+        self._rose_to_host_map[rose_fh] = -1
+        return host_fh
 
 
-# These are tight regexes for the prefixes that may be applied to releases in the virtual
-# filesystem. When we want to use a release name that originated from another view (e.g. because of
-# a `cp -p`) command, we need these regexes in order to support names that originated from views
-# like Recently Added or Collages.
+# This is a tight regex for the prefixes that may be applied to releases in the virtual filesystem.
+# When we want to use a release name that originated from another view (e.g. because of a `cp -p`)
+# command, we need this regex in order to support names that originated from views like Recently
+# Added or Collages. The prefixes are mutually exclusive, so one alternation covers both.
 #
 # And if these happen to match an artist name... they're probably not worth listening to anyways
 # lol. Probably some vaporwave bullshit.
-RELEASE_PREFIX_STRIPPERS = [
-    re.compile(r"^"),
-    re.compile(r"^\[\d{4}-\d{2}-\d{2}\] "),
-    re.compile(r"^\d+\. "),
-]
+RELEASE_PREFIX_REGEX = re.compile(r"^(?:\[\d{4}-\d{2}-\d{2}\] |\d+\. )")
 
 FileCreationSpecialOp = Literal["add-track-to-playlist", "new-cover-art"]
 
 
+@dataclass(slots=True)
+class StatAttrs:
+    """
+    The attributes of a node in the virtual filesystem. VirtualFS copies these (plus an inode) into
+    an `llfuse.EntryAttributes`. The default directory and file attributes are shared between
+    nodes, so these must not be mutated.
+    """
+
+    st_mode: int
+    st_nlink: int
+    st_uid: int
+    st_gid: int
+    st_size: int
+    st_atime_ns: int
+    st_mtime_ns: int
+    st_ctime_ns: int
+
+
+# The permission bits of every node in the virtual filesystem, keyed on the node type.
+STAT_MODES: Final[dict[Literal["dir", "file"], int]] = {
+    "dir": stat.S_IFDIR | 0o755,
+    "file": stat.S_IFREG | 0o644,
+}
+
+# Releases with at most this many tracks are stat-ed inline in readdir rather than in the stat pool.
+STAT_INLINE_MAX_TRACKS: Final[int] = 8
+
+# posix_fadvise is not available on every platform (e.g. macOS).
+HAS_FADVISE: Final[bool] = hasattr(os, "posix_fadvise")
+
+# The open flags under which a file handle may write to the file.
+WRITE_FLAGS: Final[int] = os.O_WRONLY | os.O_RDWR
+
+# Shells, file managers, and indexers probe for many names that don't exist, and VirtualFS rejects
+# most of those probes from its caches. Reuse one error for those rejections rather than allocating
+# one per probe. Raise it with `.with_traceback(None)`, so that it doesn't accumulate the frames of
+# every raise.
+ENOENT_ERROR: Final[llfuse.FUSEError] = llfuse.FUSEError(errno.ENOENT)
+
+
 class RoseLogicalCore:
     def __init__(self, config: Config, fhandler: FileHandleManager):
         self.config = config
@@ -416,135 +501,393 @@ class RoseLogicalCore:
         # The state is a mapping of fh -> (operation, identifier, ext, bytes). Identifier is typed
         # based on the operation, and is used to identify the playlist/release being modified.
         self.file_creation_special_ops: dict[
-            int, tuple[FileCreationSpecialOp, Any, str, bytearray]
+            int, tuple[FileCreationSpecialOp, Any, str, io.BytesIO]
         ] = {}
         # We want to trigger a cache update whenever we notice that a file has been updated through
         # the virtual filesystem. To do this, we insert the file handle and release ID on open, and
         # then trigger the cache update on release. We use this variable to transport that state
         # between the two syscalls.
         self.update_release_on_fh_close: dict[int, str] = {}
+        # getattr is called for every release directory (and every file inside of it) when a
+        # directory is walked. Rather than scanning all releases of an artist/genre/label/collage on
+        # each call, we build an index of virtual_dirname -> source_path once and hold onto it for a
+        # short period. The index is keyed on (kind, name), e.g. ("artist", "BLACKPINK"). The New
+        # view is indexed as ("new", ""), and only contains the `{NEW} `-prefixed releases.
+        self._release_index_cache: cachetools.TTLCache[tuple[str, str], dict[str, Path]] = (
+            cachetools.TTLCache(maxsize=64, ttl=1)
+        )
+        # Similarly, media players stat every track of a playlist in turn. Index each playlist's
+        # tracks by (virtual_filename, position) so that each lookup is a dict access.
+        self._playlist_index_cache: cachetools.TTLCache[
+            str, tuple[CachedPlaylist, dict[tuple[str, int], CachedTrack]]
+        ] = cachetools.TTLCache(maxsize=32, ttl=1)
+        # Every getattr beneath an artist/genre/label/collage/release first checks that the parent
+        # entity exists. During a directory walk, the same handful of entities are checked over and
+        # over, so memoize the results of the existence queries for a short period. The cache is
+        # keyed on (kind, name), e.g. ("label", "Silk Music").
+        self._exists_cache: cachetools.TTLCache[tuple[str, str], Any] = cachetools.TTLCache(
+            maxsize=8192, ttl=2
+        )
+        # Likewise, the stats of a release's directory and files, keyed on (release virtual dirname,
+        # filename), where the filename is empty for the directory itself. This saves the cache
+        # query and the stat syscall when a file is stat-ed repeatedly. Missing files are cached as
+        # None.
+        self._release_child_stat_cache: cachetools.TTLCache[tuple[str, str], StatAttrs | None] = (
+            cachetools.TTLCache(maxsize=16384, ttl=2)
+        )
+        # Media players and copies open every track of a release in turn. Hold onto the release,
+        # with its tracks indexed by virtual_filename, for a short period so that each open doesn't
+        # refetch it from the cache or scan its tracks. (Playlists go through the playlist index.)
+        self._release_cache: cachetools.TTLCache[
+            str, tuple[CachedRelease, dict[str, CachedTrack]]
+        ] = cachetools.TTLCache(maxsize=256, ttl=2)
+        # The directory names of the Artists, Genres, and Labels views: the sanitized names of the
+        # entities that the whitelists and blacklists allow. Listing a view repeatedly then skips
+        # the cache query and the filters. Keyed on the entity kind.
+        self._entity_dirnames_cache: cachetools.TTLCache[str, list[str]] = cachetools.TTLCache(
+            maxsize=3, ttl=2
+        )
+        # A pool for stat-ing a release's tracks concurrently in readdir. Threads are only spawned
+        # once work is submitted.
+        self._stat_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rose-stat")
+        # stat is called for every node of every readdir. Cache the uid/gid rather than making the
+        # syscalls on every call.
+        self._uid = os.getuid()
+        self._gid = os.getgid()
+        # Nodes that aren't backed by a file on disk all have the same attributes, so build them
+        # once and share them.
+        self._default_stats: dict[Literal["dir", "file"], StatAttrs] = {
+            mode: StatAttrs(
+                st_mode=STAT_MODES[mode],
+                st_nlink=4,
+                st_uid=self._uid,
+                st_gid=self._gid,
+                st_size=4096,
+                st_atime_ns=0,
+                st_mtime_ns=0,
+                st_ctime_ns=0,
+            )
+            for mode in ("dir", "file")
+        }
+        # The file creation special ops hand their bytes to functions that take a path on disk,
+        # keyed on the file extension. Spill the bytes into one temporary directory for the life of
+        # the process rather than creating and deleting a directory per op. Created on first use.
+        self._spill_dir: tempfile.TemporaryDirectory[str] | None = None
+        # Route getattr and readdir to a handler per view, rather than testing the path against
+        # each view in turn.
+        self._getattr_dispatch: dict[VirtualView, Callable[[VirtualPath], StatAttrs]] = {
+            "Root": self._getattr_root,
+            "Releases": self._getattr_releases,
+            "New": self._getattr_new,
+            "Recently Added": self._getattr_releases,
+            "Artists": self._getattr_artists,
+            "Genres": self._getattr_genres,
+            "Labels": self._getattr_labels,
+            "Collages": self._getattr_collages,
+            "Playlists": self._getattr_playlists,
+        }
+        self._readdir_dispatch: dict[
+            VirtualView, Callable[[VirtualPath], Iterator[tuple[str, StatAttrs]]]
+        ] = {
+            "Root": self._readdir_root,
+            "Releases": self._readdir_releases,
+            "New": self._readdir_releases,
+            "Recently Added": self._readdir_recently_added,
+            "Artists": self._readdir_artists,
+            "Genres": self._readdir_genres,
+            "Labels": self._readdir_labels,
+            "Collages": self._readdir_collages,
+            "Playlists": self._readdir_playlists,
+        }
+        self._open_dispatch: dict[VirtualView, Callable[[VirtualPath, int], int]] = {
+            "Releases": self._open_release,
+            "New": self._open_release,
+            "Recently Added": self._open_release,
+            "Artists": self._open_release,
+            "Genres": self._open_release,
+            "Labels": self._open_release,
+            "Collages": self._open_release,
+            "Playlists": self._open_playlist,
+        }
         super().__init__()
 
-    @staticmethod
-    def stat(mode: Literal["dir", "file"], realpath: Path | None = None) -> dict[str, Any]:
-        attrs: dict[str, Any] = {}
-        attrs["st_mode"] = (stat.S_IFDIR | 0o755) if mode == "dir" else (stat.S_IFREG | 0o644)
-        attrs["st_nlink"] = 4
-        attrs["st_uid"] = os.getuid()
-        attrs["st_gid"] = os.getgid()
-
-        attrs["st_size"] = 4096
-        attrs["st_atime_ns"] = 0.0
-        attrs["st_mtime_ns"] = 0.0
-        attrs["st_ctime_ns"] = 0.0
-        if realpath:
-            s = realpath.stat()
-            attrs["st_size"] = s.st_size
-            attrs["st_atime_ns"] = s.st_atime
-            attrs["st_mtime_ns"] = s.st_mtime
-            attrs["st_ctime_ns"] = s.st_ctime
+    def reset_caches(self) -> None:
+        # Called whenever we mutate the library through the virtual filesystem, so that the next
+        # call observes the mutation.
+        self._release_index_cache.clear()
+        self._playlist_index_cache.clear()
+        self._exists_cache.clear()
+        self._release_child_stat_cache.clear()
+        self._release_cache.clear()
+        self._entity_dirnames_cache.clear()
+
+    @contextlib.contextmanager
+    def _mutation(self) -> Iterator[None]:
+        """
+        Wrap a mutation of the library. The caches are reset once the mutation finishes, even if it
+        fails, so that nothing read into them during the mutation outlives it.
+        """
+        try:
+            yield
+        finally:
+            self.reset_caches()
+
+    def _get_entity_dirnames(self, kind: Literal["artist", "genre", "label"]) -> list[str]:
+        if (cached := self._entity_dirnames_cache.get(kind)) is not None:
+            return cached
+        lister, can_show = {
+            "artist": (list_artists, self.can_show.artist),
+            "genre": (list_genres, self.can_show.genre),
+            "label": (list_labels, self.can_show.label),
+        }[kind]
+        dirnames = [sanitized for name, sanitized in lister(self.config) if can_show(name)]
+        self._entity_dirnames_cache[kind] = dirnames
+        return dirnames
+
+    def _get_release_index(
+        self,
+        kind: Literal["all", "artist", "genre", "label", "collage", "new"],
+        name: str,
+    ) -> dict[str, Path]:
+        if (cached := self._release_index_cache.get((kind, name))) is not None:
+            return cached
+        index: dict[str, Path]
+        if kind == "collage":
+            index = {sys.intern(d): sp for _, d, sp in list_collage_releases(self.config, name)}
+        elif kind == "new":
+            index = {
+                sys.intern(r.virtual_dirname): r.source_path
+                for r in list_releases(self.config, new=True)
+            }
+        else:
+            index = {
+                sys.intern(r.virtual_dirname): r.source_path
+                for r in list_releases(
+                    self.config,
+                    sanitized_artist_filter=name if kind == "artist" else None,
+                    sanitized_genre_filter=name if kind == "genre" else None,
+                    sanitized_label_filter=name if kind == "label" else None,
+                )
+            }
+        self._release_index_cache[(kind, name)] = index
+        return index
 
-        return attrs
+    def _exists(
+        self,
+        kind: Literal["artist", "genre", "label", "collage"],
+        name: str,
+    ) -> bool:
+        if (cached := self._exists_cache.get((kind, name))) is not None:
+            return cached  # type: ignore
+        if kind == "artist":
+            exists = artist_exists(self.config, name)
+        elif kind == "genre":
+            exists = genre_exists(self.config, name)
+        elif kind == "label":
+            exists = label_exists(self.config, name)
+        else:
+            exists = collage_exists(self.config, name)
+        self._exists_cache[(kind, name)] = exists
+        return exists
+
+    def _release_exists(self, virtual_dirname: str) -> Path | None:
+        # None is a valid cached value here, so test for the key rather than the value.
+        try:
+            return self._exists_cache[("release", virtual_dirname)]  # type: ignore
+        except KeyError:
+            pass
+        rp = release_exists(self.config, virtual_dirname)
+        self._exists_cache[("release", virtual_dirname)] = rp
+        return rp
+
+    def _get_release(self, name: str) -> tuple[CachedRelease, dict[str, CachedTrack]] | None:
+        if (cached := self._release_cache.get(name)) is not None:
+            return cached
+        rdata = get_release(self.config, name)
+        if rdata is None:
+            return None
+        release, tracks = rdata
+        # Virtual filenames are unique within a release.
+        self._release_cache[name] = (release, {t.virtual_filename: t for t in tracks})
+        return self._release_cache[name]
+
+    def _open_track(self, track: CachedTrack, flags: int) -> int:
+        fd = os.open(str(track.source_path), flags)
+        # Tracks are almost always read front to back by a player or a copy. Tell the host kernel,
+        # so that it reads ahead more aggressively and each of our reads is served from its page
+        # cache rather than waiting on the disk.
+        # This is only a hint, so don't fail the open if the host filesystem rejects it.
+        if HAS_FADVISE:
+            with contextlib.suppress(OSError):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return fd
+
+    @contextlib.contextmanager
+    def _spill(self, fh: int, ext: str, b: io.BytesIO) -> Iterator[Path]:
+        """Write a special op's buffer to a temporary file, which is deleted on exit."""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="rose-")
+        path = Path(self._spill_dir.name) / f"{fh}{ext}"
+        with path.open("wb") as fp:
+            fp.write(b.getbuffer())
+        try:
+            yield path
+        finally:
+            path.unlink(missing_ok=True)
+
+    def _get_playlist_index(
+        self,
+        name: str,
+    ) -> tuple[CachedPlaylist, dict[tuple[str, int], CachedTrack]] | None:
+        if (cached := self._playlist_index_cache.get(name)) is not None:
+            return cached
+        pdata = get_playlist(self.config, name)
+        if pdata is None:
+            return None
+        playlist, tracks = pdata
+        index = {(t.virtual_filename, i + 1): t for i, t in enumerate(tracks)}
+        self._playlist_index_cache[name] = (playlist, index)
+        return playlist, index
+
+    def stat(self, mode: Literal["dir", "file"], realpath: str | Path | None = None) -> StatAttrs:
+        if realpath is None:
+            return self._default_stats[mode]
+        # os.stat rather than Path.stat, which round-trips through the Path accessors.
+        return self._stat_from_os_stat(mode, os.stat(realpath))
+
+    def _stat_from_os_stat(
+        self,
+        mode: Literal["dir", "file"],
+        s: os.stat_result,
+    ) -> StatAttrs:
+        return StatAttrs(
+            st_mode=STAT_MODES[mode],
+            st_nlink=4,
+            st_uid=self._uid,
+            st_gid=self._gid,
+            st_size=s.st_size,
+            st_atime_ns=s.st_atime_ns,
+            st_mtime_ns=s.st_mtime_ns,
+            st_ctime_ns=s.st_ctime_ns,
+        )
 
-    def getattr(self, p: VirtualPath) -> dict[str, Any]:
-        logger.debug(f"LOGICAL: Received getattr for {p=}")
+    def getattr(self, p: VirtualPath) -> StatAttrs:
+        logger.debug("LOGICAL: Received getattr for p=%r", p)
+        handler = self._getattr_dispatch.get(p.view) if p.view else None
+        # Wtf are you doing here?
+        if handler is None:
+            raise llfuse.FUSEError(errno.ENOENT)
+        return handler(p)
 
-        # Common logic that gets called for each release.
-        def getattr_release(rp: Path) -> dict[str, Any]:
-            assert p.release is not None
+    # Common logic that gets called for each release.
+    def _getattr_release(self, p: VirtualPath, rp: Path) -> StatAttrs:
+        assert p.release is not None
+        key = (p.release, p.file or "")
+        try:
+            attrs = self._release_child_stat_cache[key]
+        except KeyError:
             # If no file, return stat for the release dir.
             if not p.file:
-                return self.stat("dir", rp)
+                attrs = self.stat("dir", rp)
             # If there is a file, getattr the file.
-            if tp := track_exists(self.config, p.release, p.file):
-                return self.stat("file", tp)
-            if cp := cover_exists(self.config, p.release, p.file):
-                return self.stat("file", cp)
-            # If no file matches, return errno.ENOENT.
+            elif fp := resolve_release_child(self.config, p.release, p.file):
+                attrs = self.stat("file", fp)
+            else:
+                attrs = None
+            self._release_child_stat_cache[key] = attrs
+        # If no file matches, return errno.ENOENT.
+        if attrs is None:
             raise llfuse.FUSEError(errno.ENOENT)
+        return attrs
 
-        # 8. Playlists
-        if p.playlist:
-            try:
-                playlist, tracks = get_playlist(self.config, p.playlist)  # type: ignore
-            except TypeError as e:
-                raise llfuse.FUSEError(errno.ENOENT) from e
-            if p.file:
-                if p.file_position:
-                    for idx, track in enumerate(tracks):
-                        if track.virtual_filename == p.file and idx + 1 == int(p.file_position):
-                            return self.stat("file", track.source_path)
-                if playlist.cover_path and f"cover{playlist.cover_path.suffix}" == p.file:
-                    return self.stat("file", playlist.cover_path)
-                raise llfuse.FUSEError(errno.ENOENT)
-            return self.stat("dir")
+    # 0. Root
+    def _getattr_root(self, p: VirtualPath) -> StatAttrs:  # noqa: ARG002
+        return self.stat("dir")
 
-        # 7. Collages
-        if p.collage:
-            if not collage_exists(self.config, p.collage):
+    # {1,3}. Releases
+    def _getattr_releases(self, p: VirtualPath) -> StatAttrs:
+        if p.release:
+            if rp := self._release_exists(p.release):
+                return self._getattr_release(p, rp)
+            raise llfuse.FUSEError(errno.ENOENT)
+        return self.stat("dir")
+
+    # 2. Releases - New
+    def _getattr_new(self, p: VirtualPath) -> StatAttrs:
+        if p.release:
+            if rp := self._get_release_index("new", "").get(p.release):
+                return self._getattr_release(p, rp)
+            raise llfuse.FUSEError(errno.ENOENT)
+        return self.stat("dir")
+
+    # 4. Artists
+    def _getattr_artists(self, p: VirtualPath) -> StatAttrs:
+        if p.artist:
+            if not self._exists("artist", p.artist) or not self.can_show.artist(p.artist):
                 raise llfuse.FUSEError(errno.ENOENT)
             if p.release:
-                for _, virtual_dirname, src_path in list_collage_releases(self.config, p.collage):
-                    if virtual_dirname == p.release:
-                        return getattr_release(src_path)
+                if rp := self._get_release_index("artist", p.artist).get(p.release):
+                    return self._getattr_release(p, rp)
                 raise llfuse.FUSEError(errno.ENOENT)
-            return self.stat("dir")
+        return self.stat("dir")
 
-        # 6. Labels
-        if p.label:
-            if not label_exists(self.config, p.label) or not self.can_show.label(p.label):
+    # 5. Genres
+    def _getattr_genres(self, p: VirtualPath) -> StatAttrs:
+        if p.genre:
+            if not self._exists("genre", p.genre) or not self.can_show.genre(p.genre):
                 raise llfuse.FUSEError(errno.ENOENT)
             if p.release:
-                for r in list_releases(self.config, sanitized_label_filter=p.label):
-                    if r.virtual_dirname == p.release:
-                        return getattr_release(r.source_path)
+                if rp := self._get_release_index("genre", p.genre).get(p.release):
+                    return self._getattr_release(p, rp)
                 raise llfuse.FUSEError(errno.ENOENT)
-            return self.stat("dir")
+        return self.stat("dir")
 
-        # 5. Genres
-        if p.genre:
-            if not genre_exists(self.config, p.genre) or not self.can_show.genre(p.genre):
+    # 6. Labels
+    def _getattr_labels(self, p: VirtualPath) -> StatAttrs:
+        if p.label:
+            if not self._exists("label", p.label) or not self.can_show.label(p.label):
                 raise llfuse.FUSEError(errno.ENOENT)
             if p.release:
-                for r in list_releases(self.config, sanitized_genre_filter=p.genre):
-                    if r.virtual_dirname == p.release:
-                        return getattr_release(r.source_path)
+                if rp := self._get_release_index("label", p.label).get(p.release):
+                    return self._getattr_release(p, rp)
                 raise llfuse.FUSEError(errno.ENOENT)
-            return self.stat("dir")
+        return self.stat("dir")
 
-        # 4. Artists
-        if p.artist:
-            if not artist_exists(self.config, p.artist) or not self.can_show.artist(p.artist):
+    # 7. Collages
+    def _getattr_collages(self, p: VirtualPath) -> StatAttrs:
+        if p.collage:
+            if not self._exists("collage", p.collage):
                 raise llfuse.FUSEError(errno.ENOENT)
             if p.release:
-                for r in list_releases(self.config, sanitized_artist_filter=p.artist):
-                    if r.virtual_dirname == p.release:
-                        return getattr_release(r.source_path)
+                if rp := self._get_release_index("collage", p.collage).get(p.release):
+                    return self._getattr_release(p, rp)
                 raise llfuse.FUSEError(errno.ENOENT)
-            return self.stat("dir")
+        return self.stat("dir")
 
-        # {1,2,3}. Releases
-        if p.release:
-            if p.view == "New" and not p.release.startswith("{NEW} "):
+    # 8. Playlists
+    def _getattr_playlists(self, p: VirtualPath) -> StatAttrs:
+        if p.playlist:
+            pindex = self._get_playlist_index(p.playlist)
+            if pindex is None:
                 raise llfuse.FUSEError(errno.ENOENT)
-            if rp := release_exists(self.config, p.release):
-                return getattr_release(rp)
-            raise llfuse.FUSEError(errno.ENOENT)
-
-        # 0. Root
-        elif p.view:
-            return self.stat("dir")
-
-        # -1. Wtf are you doing here?
-        raise llfuse.FUSEError(errno.ENOENT)
+            playlist, tracks_by_position = pindex
+            if p.file:
+                if p.file_position is not None and (
+                    track := tracks_by_position.get((p.file, p.file_position))
+                ):
+                    return self.stat("file", track.source_path)
+                if playlist.cover_path and f"cover{playlist.cover_path.suffix}" == p.file:
+                    return self.stat("file", playlist.cover_path)
+                raise llfuse.FUSEError(errno.ENOENT)
+        return self.stat("dir")
 
-    def readdir(self, p: VirtualPath) -> Iterator[tuple[str, dict[str, Any]]]:
-        logger.debug(f"LOGICAL: Received readdir for {p=}")
+    def readdir(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        logger.debug("LOGICAL: Received readdir for p=%r", p)
 
         # Call getattr to validate existence. We can now assume that the provided path exists. This
         # for example includes checks that a given album belongs to the artist/genre/label/collage
         # its nested under.
-        logger.debug(f"LOGICAL: Invoking getattr in readdir to validate existence of {p}")
+        logger.debug("LOGICAL: Invoking getattr in readdir to validate existence of %s", p)
         self.getattr(p)
 
         yield from [
@@ -552,377 +895,449 @@ class RoseLogicalCore:
             ("..", self.stat("dir")),
         ]
 
-        if p.view == "Root":
-            yield from [
-                ("1. Releases", self.stat("dir")),
-                ("2. Releases - New", self.stat("dir")),
-                ("3. Releases - Recently Added", self.stat("dir")),
-                ("4. Artists", self.stat("dir")),
-                ("5. Genres", self.stat("dir")),
-                ("6. Labels", self.stat("dir")),
-                ("7. Collages", self.stat("dir")),
-                ("8. Playlists", self.stat("dir")),
-            ]
+        # A release directory has the same contents regardless of the view it's nested under.
+        if p.release:
+            yield from self._readdir_release(p)
             return
 
-        if p.release:
-            if cachedata := get_release(self.config, p.release):
-                release, tracks = cachedata
-                for track in tracks:
-                    filename = f"{track.formatted_release_position}. {track.virtual_filename}"
-                    yield filename, self.stat("file", track.source_path)
-                if release.cover_image_path:
-                    yield release.cover_image_path.name, self.stat("file", release.cover_image_path)
-                return
+        handler = self._readdir_dispatch.get(p.view) if p.view else None
+        if handler is None:
             raise llfuse.FUSEError(errno.ENOENT)
-
-        if p.artist or p.genre or p.label or p.view == "Releases" or p.view == "New":
-            for release in list_releases(
-                self.config,
-                sanitized_artist_filter=p.artist,
-                sanitized_genre_filter=p.genre,
-                sanitized_label_filter=p.label,
-                new=True if p.view == "New" else None,
-            ):
-                yield release.virtual_dirname, self.stat("dir", release.source_path)
+        yield from handler(p)
+
+    def _readdir_release(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        assert p.release is not None
+        if cachedata := get_release(self.config, p.release):
+            release, tracks = cachedata
+            # Stat the tracks concurrently, so that the host filesystem services the stat syscalls
+            # in parallel instead of one after another. Handing a stat to the pool costs more than a
+            # stat of a cached inode, so small releases are stat-ed inline.
+            paths = [t.source_path for t in tracks]
+            stats: Iterator[os.stat_result] = (
+                self._stat_executor.map(os.stat, paths)
+                if len(paths) > STAT_INLINE_MAX_TRACKS
+                else map(os.stat, paths)
+            )
+            # Record the stats for getattr as well, which would otherwise query the cache and stat
+            # each file again when the listing is followed by a stat of every entry (e.g. `ls -l`).
+            for track, s in zip(tracks, stats, strict=True):
+                filename = f"{track.formatted_release_position}. {track.virtual_filename}"
+                attrs = self._stat_from_os_stat("file", s)
+                self._release_child_stat_cache[(p.release, track.virtual_filename)] = attrs
+                yield filename, attrs
+            if release.cover_image_path:
+                attrs = self.stat("file", release.cover_image_path)
+                self._release_child_stat_cache[(p.release, release.cover_image_path.name)] = attrs
+                yield release.cover_image_path.name, attrs
             return
+        raise llfuse.FUSEError(errno.ENOENT)
 
-        if p.view == "Recently Added":
-            for release in list_releases(self.config):
-                dirname = f"[{release.added_at[:10]}] {release.virtual_dirname}"
-                yield dirname, self.stat("dir", release.source_path)
-            return
+    def _readdir_root(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:  # noqa: ARG002
+        yield from [
+            ("1. Releases", self.stat("dir")),
+            ("2. Releases - New", self.stat("dir")),
+            ("3. Releases - Recently Added", self.stat("dir")),
+            ("4. Artists", self.stat("dir")),
+            ("5. Genres", self.stat("dir")),
+            ("6. Labels", self.stat("dir")),
+            ("7. Collages", self.stat("dir")),
+            ("8. Playlists", self.stat("dir")),
+        ]
 
-        elif p.view == "Artists":
-            for artist, sanitized_artist in list_artists(self.config):
-                if not self.can_show.artist(artist):
-                    continue
-                yield sanitized_artist, self.stat("dir")
+    def _readdir_releases(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        # List from the same index that getattr checks the releases against, so that the getattr
+        # of each listed release is served from the index built here rather than a new query.
+        if p.artist:
+            index = self._get_release_index("artist", p.artist)
+        elif p.genre:
+            index = self._get_release_index("genre", p.genre)
+        elif p.label:
+            index = self._get_release_index("label", p.label)
+        elif p.view == "New":
+            index = self._get_release_index("new", "")
+        else:
+            index = self._get_release_index("all", "")
+        for virtual_dirname, source_path in index.items():
+            yield virtual_dirname, self.stat("dir", source_path)
+
+    def _readdir_recently_added(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:  # noqa: ARG002
+        for release in list_releases(self.config):
+            dirname = f"[{release.added_at[:10]}] {release.virtual_dirname}"
+            yield dirname, self.stat("dir", release.source_path)
+
+    def _readdir_artists(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        if p.artist:
+            yield from self._readdir_releases(p)
             return
+        for dirname in self._get_entity_dirnames("artist"):
+            yield dirname, self.stat("dir")
 
-        if p.view == "Genres":
-            for genre, sanitized_genre in list_genres(self.config):
-                if not self.can_show.genre(genre):
-                    continue
-                yield sanitized_genre, self.stat("dir")
+    def _readdir_genres(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        if p.genre:
+            yield from self._readdir_releases(p)
             return
+        for dirname in self._get_entity_dirnames("genre"):
+            yield dirname, self.stat("dir")
 
-        if p.view == "Labels":
-            for label, sanitized_label in list_labels(self.config):
-                if not self.can_show.label(label):
-                    continue
-                yield sanitized_label, self.stat("dir")
+    def _readdir_labels(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        if p.label:
+            yield from self._readdir_releases(p)
             return
+        for dirname in self._get_entity_dirnames("label"):
+            yield dirname, self.stat("dir")
 
-        if p.view == "Collages" and p.collage:
+    def _readdir_collages(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        if p.collage:
             releases = list(list_collage_releases(self.config, p.collage))
-            # Two zeros because `max(single_arg)` assumes that the single_arg is enumerable.
-            pad_size = max(0, 0, *[len(str(r[0])) for r in releases])
+            # Releases are ordered by position, so the last release has the widest position.
+            pad_size = len(str(releases[-1][0])) if releases else 0
             for idx, virtual_dirname, source_dir in releases:
                 v = f"{str(idx).zfill(pad_size)}. {virtual_dirname}"
                 yield v, self.stat("dir", source_dir)
             return
+        # Don't need to sanitize because the collage names come from filenames.
+        for collage in list_collages(self.config):
+            yield collage, self.stat("dir")
 
-        if p.view == "Collages":
-            # Don't need to sanitize because the collage names come from filenames.
-            for collage in list_collages(self.config):
-                yield collage, self.stat("dir")
-            return
-
-        if p.view == "Playlists" and p.playlist:
+    def _readdir_playlists(self, p: VirtualPath) -> Iterator[tuple[str, StatAttrs]]:
+        if p.playlist:
             pdata = get_playlist(self.config, p.playlist)
             if pdata is None:
                 raise llfuse.FUSEError(errno.ENOENT)
             playlist, tracks = pdata
-            pad_size = max(0, 0, *[len(str(i + 1)) for i, _ in enumerate(tracks)])
+            pad_size = len(str(len(tracks))) if tracks else 0
             for idx, track in enumerate(tracks):
-                v = f"{str(idx+1).zfill(pad_size)}. {track.virtual_filename}"
+                v = f"{str(idx + 1).zfill(pad_size)}. {track.virtual_filename}"
                 yield v, self.stat("file", track.source_path)
             if playlist.cover_path:
                 v = f"cover{playlist.cover_path.suffix}"
                 yield v, self.stat("file", playlist.cover_path)
             return
-
-        if p.view == "Playlists":
-            # Don't need to sanitize because the playlist names come from filenames.
-            for pname in list_playlists(self.config):
-                yield pname, self.stat("dir")
-            return
-
-        raise llfuse.FUSEError(errno.ENOENT)
+        # Don't need to sanitize because the playlist names come from filenames.
+        for pname in list_playlists(self.config):
+            yield pname, self.stat("dir")
 
     def unlink(self, p: VirtualPath) -> None:
-        logger.debug(f"LOGICAL: Received unlink for {p=}")
-
-        # Possible actions:
-        # 1. Delete a playlist.
-        # 2. Delete a track from a playlist.
-        # 3. Delete cover art from a playlist.
-        # 4. Delete cover art from a release.
-        if p.view == "Playlists" and p.playlist and p.file is None:
-            delete_playlist(self.config, p.playlist)
-            return
-        if (
-            p.view == "Playlists"
-            and p.playlist
-            and p.file
-            and p.file_position
-            and (pdata := get_playlist(self.config, p.playlist))
-        ):
-            for idx, track in enumerate(pdata[1]):
-                if track.virtual_filename == p.file and idx + 1 == int(p.file_position):
-                    remove_track_from_playlist(self.config, p.playlist, track.id)
-                    return
-            raise llfuse.FUSEError(errno.ENOENT)
-        if (
-            p.view == "Playlists"
-            and p.playlist
-            and p.file
-            and p.file.lower() in self.config.valid_cover_arts
-            and (pdata := get_playlist(self.config, p.playlist))
-        ):
-            remove_playlist_cover_art(self.config, pdata[0].name)
-        if (
-            p.release
-            and p.file
-            and p.file.lower() in self.config.valid_cover_arts
-            and (rdata := get_release(self.config, p.release))
-        ):
-            remove_release_cover_art(self.config, rdata[0].id)
+        logger.debug("LOGICAL: Received unlink for p=%r", p)
+        with self._mutation():
+            # Possible actions:
+            # 1. Delete a playlist.
+            # 2. Delete a track from a playlist.
+            # 3. Delete cover art from a playlist.
+            # 4. Delete cover art from a release.
+            if p.view == "Playlists" and p.playlist and p.file is None:
+                delete_playlist(self.config, p.playlist)
+                return
+            if (
+                p.view == "Playlists"
+                and p.playlist
+                and p.file
+                and p.file_position is not None
+                and (pdata := get_playlist(self.config, p.playlist))
+            ):
+                # Read the playlist directly rather than through the playlist index: the index is a
+                # read cache, and refilling it here would outlive the removal.
+                for idx, track in enumerate(pdata[1]):
+                    if track.virtual_filename == p.file and idx + 1 == p.file_position:
+                        remove_track_from_playlist(self.config, p.playlist, track.id)
+                        return
+                raise llfuse.FUSEError(errno.ENOENT)
+            if (
+                p.view == "Playlists"
+                and p.playlist
+                and p.file
+                and p.file.lower() in self.config.valid_cover_arts
+                and (pdata := get_playlist(self.config, p.playlist))
+            ):
+                remove_playlist_cover_art(self.config, pdata[0].name)
+            if (
+                p.release
+                and p.file
+                and p.file.lower() in self.config.valid_cover_arts
+                and (rdata := get_release(self.config, p.release))
+            ):
+                remove_release_cover_art(self.config, rdata[0].id)
 
-        # Otherwise, noop. If we return an error, that prevents rmdir from being called when we rm.
+            # Otherwise, noop. If we return an error, that prevents rmdir from being called when we
+            # rm.
 
     def mkdir(self, p: VirtualPath) -> None:
-        logger.debug(f"LOGICAL: Received mkdir for {p=}")
-
-        # Possible actions:
-        # 1. Add a release to an existing collage.
-        # 2. Create a new collage.
-        # 3. Create a new playlist.
-        if p.collage and p.release is None:
-            create_collage(self.config, p.collage)
-            return
-        if p.collage and p.release:
-            err = None
-            # Because some releases have prefixes, attempt multiple times with each different prefix
-            # stripper.
-            seen: set[str] = set()
-            for prefix_stripper in RELEASE_PREFIX_STRIPPERS:
-                rls = prefix_stripper.sub("", p.release)
-                # But don't waste effort if nothing changed.
-                if rls in seen:
-                    continue
-                seen.add(rls)
+        logger.debug("LOGICAL: Received mkdir for p=%r", p)
+        with self._mutation():
+            # Possible actions:
+            # 1. Add a release to an existing collage.
+            # 2. Create a new collage.
+            # 3. Create a new playlist.
+            if p.collage and p.release is None:
+                create_collage(self.config, p.collage)
+                return
+            if p.collage and p.release:
+                # Because some releases have prefixes, attempt again with the prefix stripped if the
+                # release name as-is does not exist.
                 try:
-                    add_release_to_collage(self.config, p.collage, rls)
+                    add_release_to_collage(self.config, p.collage, p.release)
                     return
                 except ReleaseDoesNotExistError as e:
                     err = e
-            logger.debug(
-                f"LOGICAL: Failed adding release {p.release} to collage {p.collage}: "
-                "release not found"
-            )
-            raise llfuse.FUSEError(errno.ENOENT) from err
-        if p.playlist and p.file is None:
-            create_playlist(self.config, p.playlist)
-            return
+                rls = RELEASE_PREFIX_REGEX.sub("", p.release, count=1)
+                # But don't waste effort if nothing changed.
+                if rls != p.release:
+                    try:
+                        add_release_to_collage(self.config, p.collage, rls)
+                        return
+                    except ReleaseDoesNotExistError as e:
+                        err = e
+                logger.debug(
+                    "LOGICAL: Failed adding release %s to collage %s: release not found",
+                    p.release,
+                    p.collage,
+                )
+                raise llfuse.FUSEError(errno.ENOENT) from err
+            if p.playlist and p.file is None:
+                create_playlist(self.config, p.playlist)
+                return
 
-        raise llfuse.FUSEError(errno.EACCES)
+            raise llfuse.FUSEError(errno.EACCES)
 
     def rmdir(self, p: VirtualPath) -> None:
-        logger.debug(f"LOGICAL: Received rmdir for {p=}")
-
-        # Possible actions:
-        # 1. Delete a collage.
-        # 2. Delete a release from an existing collage.
-        # 3. Delete a playlist.
-        # 4. Delete a release.
-        if p.view == "Collages" and p.collage and p.release is None:
-            delete_collage(self.config, p.collage)
-            return
-        if p.view == "Collages" and p.collage and p.release:
-            remove_release_from_collage(self.config, p.collage, p.release)
-            return
-        if p.view == "Playlists" and p.playlist and p.file is None:
-            delete_playlist(self.config, p.playlist)
-            return
-        if p.view != "Collages" and p.release is not None:
-            delete_release(self.config, p.release)
-            return
+        logger.debug("LOGICAL: Received rmdir for p=%r", p)
+        with self._mutation():
+            # Possible actions:
+            # 1. Delete a collage.
+            # 2. Delete a release from an existing collage.
+            # 3. Delete a playlist.
+            # 4. Delete a release.
+            if p.view == "Collages" and p.collage and p.release is None:
+                delete_collage(self.config, p.collage)
+                return
+            if p.view == "Collages" and p.collage and p.release:
+                remove_release_from_collage(self.config, p.collage, p.release)
+                return
+            if p.view == "Playlists" and p.playlist and p.file is None:
+                delete_playlist(self.config, p.playlist)
+                return
+            if p.view != "Collages" and p.release is not None:
+                delete_release(self.config, p.release)
+                return
 
-        raise llfuse.FUSEError(errno.EACCES)
+            raise llfuse.FUSEError(errno.EACCES)
 
     def rename(self, old: VirtualPath, new: VirtualPath) -> None:
-        logger.debug(f"LOGICAL: Received rename for {old=} {new=}")
-
-        # Possible actions:
-        # 1. Toggle a release's new status.
-        # 2. Rename a collage.
-        # 3. Rename a playlist.
-        # TODO: Consider allowing renaming artist/genre/label here?
-        if (
-            (old.release and new.release)
-            and old.release.removeprefix("{NEW} ") == new.release.removeprefix("{NEW} ")
-            and (not old.file and not new.file)
-            and old.release.startswith("{NEW} ") != new.release.startswith("{NEW} ")
-        ):
-            toggle_release_new(self.config, old.release)
-            return
-        if (
-            old.view == "Collages"
-            and new.view == "Collages"
-            and (old.collage and new.collage)
-            and old.collage != new.collage
-            and (not old.release and not new.release)
-        ):
-            rename_collage(self.config, old.collage, new.collage)
-            return
-        if (
-            old.view == "Playlists"
-            and new.view == "Playlists"
-            and (old.playlist and new.playlist)
-            and old.playlist != new.playlist
-            and (not old.file and not new.file)
-        ):
-            rename_playlist(self.config, old.playlist, new.playlist)
-            return
+        logger.debug("LOGICAL: Received rename for old=%r new=%r", old, new)
+        with self._mutation():
+            # Possible actions:
+            # 1. Toggle a release's new status.
+            # 2. Rename a collage.
+            # 3. Rename a playlist.
+            # TODO: Consider allowing renaming artist/genre/label here?
+            if (
+                (old.release and new.release)
+                and old.release.removeprefix("{NEW} ") == new.release.removeprefix("{NEW} ")
+                and (not old.file and not new.file)
+                and old.release.startswith("{NEW} ") != new.release.startswith("{NEW} ")
+            ):
+                toggle_release_new(self.config, old.release)
+                return
+            if (
+                old.view == "Collages"
+                and new.view == "Collages"
+                and (old.collage and new.collage)
+                and old.collage != new.collage
+                and (not old.release and not new.release)
+            ):
+                rename_collage(self.config, old.collage, new.collage)
+                return
+            if (
+                old.view == "Playlists"
+                and new.view == "Playlists"
+                and (old.playlist and new.playlist)
+                and old.playlist != new.playlist
+                and (not old.file and not new.file)
+            ):
+                rename_playlist(self.config, old.playlist, new.playlist)
+                return
 
-        raise llfuse.FUSEError(errno.EACCES)
+            raise llfuse.FUSEError(errno.EACCES)
 
     def open(self, p: VirtualPath, flags: int) -> int:
-        logger.debug(f"LOGICAL: Received open for {p=} {flags=}")
-
-        err = errno.ENOENT
-        if flags & os.O_CREAT == os.O_CREAT:
-            err = errno.EACCES
-
-        if p.release and p.file and (rdata := get_release(self.config, p.release)):
-            release, tracks = rdata
-            # If the file is a music file, handle it as a music file.
-            pf = Path(p.file)
-            if pf.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS:
-                for track in tracks:
-                    if track.virtual_filename == p.file:
-                        fh = self.fhandler.wrap_host(os.open(str(track.source_path), flags))
-                        if flags & os.O_WRONLY == os.O_WRONLY or flags & os.O_RDWR == os.O_RDWR:
-                            self.update_release_on_fh_close[fh] = track.release_id
-                        return fh
-            # If the file matches the current cover image, then simply pass it through.
-            if release.cover_image_path and p.file == f"cover{release.cover_image_path.suffix}":
-                return self.fhandler.wrap_host(os.open(str(release.cover_image_path), flags))
-            # Otherwise, if we are writing a brand new cover image, initiate the "new-cover-art"
-            # sequence.
-            if p.file.lower() in self.config.valid_cover_arts and flags & os.O_CREAT == os.O_CREAT:
-                fh = self.fhandler.next()
-                logger.debug(
-                    f"LOGICAL: Begin new cover art sequence for release "
-                    f"{release.virtual_dirname=}, {p.file=}, and {fh=}"
-                )
-                self.file_creation_special_ops[fh] = (
-                    "new-cover-art",
-                    ("release", release.id),
-                    pf.suffix,
-                    bytearray(),
-                )
-                return fh
-            raise llfuse.FUSEError(err)
-        if p.playlist and p.file:
-            try:
-                playlist, tracks = get_playlist(self.config, p.playlist)  # type: ignore
-            except TypeError as e:
-                raise llfuse.FUSEError(errno.ENOENT) from e
-            # If we are trying to create an audio file in the playlist, enter the
-            # "add-track-to-playlist" operation sequence. See the __init__ for more details.
-            pf = Path(p.file)
-            if pf.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS and flags & os.O_CREAT == os.O_CREAT:
-                fh = self.fhandler.next()
-                logger.debug(
-                    f"LOGICAL: Begin playlist addition operation sequence for "
-                    f"{playlist.name=}, {p.file=}, and {fh=}"
-                )
-                self.file_creation_special_ops[fh] = (
-                    "add-track-to-playlist",
-                    p.playlist,
-                    pf.suffix,
-                    bytearray(),
-                )
-                return fh
-            # If we are trying to create a cover image in the playlist, enter the "new-cover-art"
-            # sequence for the playlist.
-            if p.file.lower() in self.config.valid_cover_arts and flags & os.O_CREAT == os.O_CREAT:
-                fh = self.fhandler.next()
-                logger.debug(
-                    f"LOGICAL: Begin new cover art sequence for playlist"
-                    f"{playlist.name=}, {p.file=}, and {fh=}"
-                )
-                self.file_creation_special_ops[fh] = (
-                    "new-cover-art",
-                    ("playlist", p.playlist),
-                    pf.suffix,
-                    bytearray(),
-                )
-                return fh
-            # Otherwise, continue on...
-            if p.file_position:
-                for idx, track in enumerate(tracks):
-                    if track.virtual_filename == p.file and idx + 1 == int(p.file_position):
-                        fh = self.fhandler.wrap_host(os.open(str(track.source_path), flags))
-                        if flags & os.O_WRONLY == os.O_WRONLY or flags & os.O_RDWR == os.O_RDWR:
-                            self.update_release_on_fh_close[fh] = track.release_id
-                        return fh
-            if playlist.cover_path and f"cover{playlist.cover_path.suffix}" == p.file:
-                return self.fhandler.wrap_host(os.open(playlist.cover_path, flags))
+        logger.debug("LOGICAL: Received open for p=%r flags=%r", p, flags)
+        handler = self._open_dispatch.get(p.view) if p.view and p.file else None
+        if handler is None:
+            raise llfuse.FUSEError(errno.EACCES if flags & os.O_CREAT else errno.ENOENT)
+        return handler(p, flags)
+
+    def _open_release(self, p: VirtualPath, flags: int) -> int:
+        assert p.file is not None
+        is_create = bool(flags & os.O_CREAT)
+        err = errno.EACCES if is_create else errno.ENOENT
+        if not p.release or not (rdata := self._get_release(p.release)):
             raise llfuse.FUSEError(err)
+        release, tracks_by_name = rdata
+        suffix = Path(p.file).suffix
+        # If the file is a music file, handle it as a music file.
+        if suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS and (track := tracks_by_name.get(p.file)):
+            fh = self.fhandler.wrap_host(self._open_track(track, flags))
+            if flags & WRITE_FLAGS:
+                self.update_release_on_fh_close[fh] = track.release_id
+            return fh
+        # If the file matches the current cover image, then simply pass it through.
+        if release.cover_image_path and p.file == f"cover{release.cover_image_path.suffix}":
+            return self.fhandler.wrap_host(os.open(str(release.cover_image_path), flags))
+        # Otherwise, if we are writing a brand new cover image, initiate the "new-cover-art"
+        # sequence.
+        if is_create and p.file.lower() in self.config.valid_cover_arts:
+            fh = self.fhandler.next()
+            logger.debug(
+                "LOGICAL: Begin new cover art sequence for release "
+                "release.virtual_dirname=%r, p.file=%r, and fh=%r",
+                release.virtual_dirname,
+                p.file,
+                fh,
+            )
+            self.file_creation_special_ops[fh] = (
+                "new-cover-art",
+                ("release", release.id),
+                suffix,
+                io.BytesIO(),
+            )
+            return fh
+        raise llfuse.FUSEError(err)
 
+    def _open_playlist(self, p: VirtualPath, flags: int) -> int:
+        assert p.file is not None
+        is_create = bool(flags & os.O_CREAT)
+        err = errno.EACCES if is_create else errno.ENOENT
+        if not p.playlist:
+            raise llfuse.FUSEError(err)
+        pindex = self._get_playlist_index(p.playlist)
+        if pindex is None:
+            raise llfuse.FUSEError(errno.ENOENT)
+        playlist, tracks_by_position = pindex
+        suffix = Path(p.file).suffix
+        # If we are trying to create an audio file in the playlist, enter the
+        # "add-track-to-playlist" operation sequence. See the __init__ for more details.
+        if is_create and suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS:
+            fh = self.fhandler.next()
+            logger.debug(
+                "LOGICAL: Begin playlist addition operation sequence for "
+                "playlist.name=%r, p.file=%r, and fh=%r",
+                playlist.name,
+                p.file,
+                fh,
+            )
+            self.file_creation_special_ops[fh] = (
+                "add-track-to-playlist",
+                p.playlist,
+                suffix,
+                io.BytesIO(),
+            )
+            return fh
+        # If we are trying to create a cover image in the playlist, enter the "new-cover-art"
+        # sequence for the playlist.
+        if is_create and p.file.lower() in self.config.valid_cover_arts:
+            fh = self.fhandler.next()
+            logger.debug(
+                "LOGICAL: Begin new cover art sequence for playlist"
+                "playlist.name=%r, p.file=%r, and fh=%r",
+                playlist.name,
+                p.file,
+                fh,
+            )
+            self.file_creation_special_ops[fh] = (
+                "new-cover-art",
+                ("playlist", p.playlist),
+                suffix,
+                io.BytesIO(),
+            )
+            return fh
+        # Otherwise, continue on...
+        if p.file_position is not None and (
+            track := tracks_by_position.get((p.file, p.file_position))
+        ):
+            fh = self.fhandler.wrap_host(self._open_track(track, flags))
+            if flags & WRITE_FLAGS:
+                self.update_release_on_fh_close[fh] = track.release_id
+            return fh
+        if playlist.cover_path and f"cover{playlist.cover_path.suffix}" == p.file:
+            return self.fhandler.wrap_host(os.open(playlist.cover_path, flags))
         raise llfuse.FUSEError(err)
 
     def read(self, fh: int, offset: int, length: int) -> bytes:
-        logger.debug(f"LOGICAL: Received read for {fh=} {offset=} {length=}")
+        logger.debug("LOGICAL: Received read for fh=%r offset=%r length=%r", fh, offset, length)
         if sop := self.file_creation_special_ops.get(fh, None):
             logger.debug("LOGICAL: Matched read to a file creation special op")
             _, _, _, b = sop
-            return b[offset : offset + length]
-        fh = self.fhandler.unwrap_host(fh)
-        os.lseek(fh, offset, os.SEEK_SET)
-        return os.read(fh, length)
+            return b.getbuffer()[offset : offset + length].tobytes()
+        # Positional I/O: one syscall, and it doesn't move a file offset that other requests on the
+        # same handle share. llfuse runs handlers under a global lock, which would serialize the
+        # worker threads on disk I/O; drop it while we wait on the host filesystem.
+        host_fh = self.fhandler.unwrap_host(fh)
+        with llfuse.lock_released:
+            return os.pread(host_fh, length, offset)
 
     def write(self, fh: int, offset: int, data: bytes) -> int:
-        logger.debug(f"LOGICAL: Received write for {fh=} {offset=} {len(data)=}")
+        logger.debug(
+            "LOGICAL: Received write for fh=%r offset=%r len(data)=%r", fh, offset, len(data)
+        )
         if sop := self.file_creation_special_ops.get(fh, None):
             logger.debug("LOGICAL: Matched write to a file creation special op")
             _, _, _, b = sop
-            del b[offset:]
-            b.extend(data)
-            return len(data)
-        fh = self.fhandler.unwrap_host(fh)
-        os.lseek(fh, offset, os.SEEK_SET)
-        return os.write(fh, data)
+            # Write at the offset rather than truncating the buffer there, so that writes which
+            # arrive out of order or overlap do not discard bytes past the written range. BytesIO
+            # zero-fills any gap and grows its buffer geometrically.
+            b.seek(offset)
+            return b.write(data)
+        host_fh = self.fhandler.unwrap_host(fh)
+        with llfuse.lock_released:
+            return os.pwrite(host_fh, data, offset)
 
     def release(self, fh: int) -> None:
-        logger.debug(f"LOGICAL: Received release for {fh=}")
-        if sop := self.file_creation_special_ops.get(fh, None):
+        logger.debug("LOGICAL: Received release for fh=%r", fh)
+        if sop := self.file_creation_special_ops.pop(fh, None):
             logger.debug("LOGICAL: Matched release to a file creation special op")
+            # The special op ends here whether or not it succeeds, so free its handle for reuse.
+            try:
+                self._release_special_op(fh, sop)
+            finally:
+                self.fhandler.release(fh)
+            return
+        if release_id := self.update_release_on_fh_close.pop(fh, None):
+            logger.debug(
+                "LOGICAL: Triggering cache update for release %s after release syscall", release_id
+            )
+            if source_path := get_release_source_path_from_id(self.config, release_id):
+                update_cache_for_releases(self.config, [source_path])
+            self.reset_caches()
+        fh = self.fhandler.release_host(fh)
+        os.close(fh)
+
+    def _release_special_op(
+        self,
+        fh: int,
+        sop: tuple[FileCreationSpecialOp, Any, str, io.BytesIO],
+    ) -> None:
+        with self._mutation():
             operation, ident, ext, b = sop
-            if not b:
+            if b.getbuffer().nbytes == 0:
                 logger.debug("LOGICAL: Aborting file creation special oprelease: no bytes to write")
                 return
             if operation == "add-track-to-playlist":
                 logger.debug("LOGICAL: Narrowed file creation special op to add track to playlist")
                 playlist = ident
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    audiopath = Path(tmpdir) / f"f{ext}"
-                    with audiopath.open("wb") as fp:
-                        fp.write(b)
+                with self._spill(fh, ext, b) as audiopath:
                     audiofile = AudioTags.from_file(audiopath)
                     track_id = audiofile.id
                 if not track_id:
                     logger.warning(
                         "LOGICAL: Failed to parse track_id from file in playlist addition "
-                        f"operation sequence: {track_id=} {fh=} {playlist=} {audiofile}"
+                        "operation sequence: track_id=%r fh=%r playlist=%r %s",
+                        track_id,
+                        fh,
+                        playlist,
+                        audiofile,
                     )
                     return
                 add_track_to_playlist(self.config, playlist, track_id)
-                del self.file_creation_special_ops[fh]
                 return
             if operation == "new-cover-art":
                 entity_type, entity_id = ident
@@ -930,33 +1345,30 @@ class RoseLogicalCore:
                     logger.debug(
                         "LOGICAL: Narrowed file creation special op to write release cover art"
                     )
-                    with tempfile.TemporaryDirectory() as tmpdir:
-                        imagepath = Path(tmpdir) / f"f{ext}"
-                        with imagepath.open("wb") as fp:
-                            fp.write(b)
+                    with self._spill(fh, ext, b) as imagepath:
                         set_release_cover_art(self.config, entity_id, imagepath)
-                    del self.file_creation_special_ops[fh]
                     return
                 if entity_type == "playlist":
                     logger.debug(
                         "LOGICAL: Narrowed file creation special op to write playlist cover art"
                     )
-                    with tempfile.TemporaryDirectory() as tmpdir:
-                        imagepath = Path(tmpdir) / f"f{ext}"
-                        with imagepath.open("wb") as fp:
-                            fp.write(b)
+                    with self._spill(fh, ext, b) as imagepath:
                         set_playlist_cover_art(self.config, entity_id, imagepath)
-                    del self.file_creation_special_ops[fh]
                     return
             raise RoseError(f"Impossible: unknown file creation special op: {operation=} {ident=}")
-        if release_id := self.update_release_on_fh_close.get(fh, None):
-            logger.debug(
-                f"LOGICAL: Triggering cache update for release {release_id} after release syscall"
-            )
-            if source_path := get_release_source_path_from_id(self.config, release_id):
-                update_cache_for_releases(self.config, [source_path])
-        fh = self.fhandler.unwrap_host(fh)
-        os.close(fh)
+
+
+def _join_path(spath: str, name: str) -> str:
+    """Join a name onto a normalized virtual path, resolving `.` and `..` lexically."""
+    if name == ".":
+        return spath
+    if name == "..":
+        return os.path.dirname(spath)
+    return f"/{name}" if spath == "/" else f"{spath}/{name}"
+
+
+# Keep inodes within 63 bits so that they stay positive wherever they end up as a signed integer.
+INODE_MASK: Final[int] = (1 << 63) - 1
 
 
 class INodeManager:
@@ -965,51 +1377,62 @@ class INodeManager:
     llfuse library makes us manage the inodes...
     """
 
+    __slots__ = ("config", "_inode_to_path_map", "_path_to_inode_map")
+
     def __init__(self, config: Config):
         self.config = config
 
-        self._inode_to_path_map: dict[int, Path] = {llfuse.ROOT_INODE: Path("/")}
+        # Paths are kept as strings rather than `Path`s: they are already normalized, and joining
+        # and splitting strings is much cheaper than pathlib's arithmetic on every call.
+        self._inode_to_path_map: dict[int, str] = {llfuse.ROOT_INODE: "/"}
         self._path_to_inode_map: dict[str, int] = {"/": llfuse.ROOT_INODE}
-        self._next_inode_ctr: int = llfuse.ROOT_INODE + 1
-
-    def _next_inode(self) -> int:
-        # Increment to infinity.
-        cur = self._next_inode_ctr
-        self._next_inode_ctr += 1
-        return cur
 
-    def get_path(self, inode: int, name: bytes | None = None) -> Path:
+    def _hash_inode(self, spath: str) -> int:
+        # Derive the inode from the path so that a path keeps its inode across FS restarts, which
+        # lets the kernel keep its dentries for the whole session. On the off chance that two paths
+        # hash to the same inode (or to the root inode), rehash with a salt until one is free.
+        salt = b""
+        while True:
+            digest = hashlib.blake2b(
+                spath.encode("utf-8", "surrogateescape"), digest_size=8, salt=salt
+            ).digest()
+            inode = (int.from_bytes(digest, "little") & INODE_MASK) | 1
+            if inode != llfuse.ROOT_INODE and inode not in self._inode_to_path_map:
+                return inode
+            salt = (int.from_bytes(salt, "little") + 1).to_bytes(8, "little")
+
+    def get_path(self, inode: int, name: bytes | None = None) -> str:
         """
         Raises ENOENT if the inode doesn't exist. If the inode is of a directory, you can optionally
         pass `name`, which will be concatenated to the directory.
         """
         try:
             path = self._inode_to_path_map[inode]
-            if not name or name == b".":
+            if not name:
                 return path
-            if name == b"..":
-                return path.parent
-            return path / name.decode()
+            # The kernel hands us names as raw bytes, which need not be valid UTF-8. Decode them so
+            # that they round-trip back to the same bytes.
+            return _join_path(path, name.decode("utf-8", "surrogateescape"))
         except KeyError as e:
             raise llfuse.FUSEError(errno.ENOENT) from e
 
-    def calc_inode(self, path: Path) -> int:
+    def calc_inode(self, spath: str) -> int:
         """
         Get the inode of a path. If we've seen the path before, return the cached inode. Otherwise,
         generate a new inode and cache it for future accesses.
+
+        The paths handed in are built by `get_path`, which roots them at `/` and handles `.` and
+        `..`, so they are already normalized. We deliberately do not `resolve()` them: that would
+        consult the host filesystem for a path that only exists virtually.
         """
-        path = path.resolve()
-        spath = str(path)
-        try:
-            return self._path_to_inode_map[spath]
-        except KeyError:
-            inode = self._next_inode()
-            self._path_to_inode_map[spath] = inode
-            self._inode_to_path_map[inode] = path
+        if (inode := self._path_to_inode_map.get(spath)) is not None:
             return inode
+        inode = self._hash_inode(spath)
+        self._path_to_inode_map[spath] = inode
+        self._inode_to_path_map[inode] = spath
+        return inode
 
-    def remove_path(self, path: Path) -> None:
-        spath = str(path.resolve())
+    def remove_path(self, spath: str) -> None:
         try:
             inode = self._path_to_inode_map[spath]
         except KeyError:
@@ -1017,14 +1440,12 @@ class INodeManager:
         del self._path_to_inode_map[spath]
         del self._inode_to_path_map[inode]
 
-    def rename_path(self, old_path: Path, new_path: Path) -> None:
-        sold = str(old_path.resolve())
-        snew = str(new_path.resolve())
+    def rename_path(self, sold: str, snew: str) -> None:
         try:
             inode = self._path_to_inode_map[sold]
         except KeyError:
             return
-        self._inode_to_path_map[inode] = new_path
+        self._inode_to_path_map[inode] = snew
         self._path_to_inode_map[snew] = inode
         del self._path_to_inode_map[sold]
 
@@ -1042,15 +1463,27 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         self.rose = RoseLogicalCore(config, self.fhandler)
         self.inodes = INodeManager(config)
         self.default_attrs = {
-            # Well, this should be ok for now. I really don't want to track this... we indeed change
-            # inodes across FS restarts.
-            "generation": random.randint(0, 1000000),
-            # Have a 30 second entry timeout by default.
-            "entry_timeout": 30,
+            # Inodes are derived from paths, so they are stable across FS restarts for the same
+            # library. Derive the generation from the library too, so that the kernel's cached
+            # entries stay valid across restarts, but not across a change of music source dir.
+            "generation": int.from_bytes(
+                hashlib.blake2b(str(config.music_source_dir).encode(), digest_size=4).digest(),
+                "little",
+            ),
+            # Let the kernel cache lookups and attributes, so that it doesn't come back to us on
+            # every stat. See the fuse_*_timeout options in the configuration docs.
+            "entry_timeout": config.fuse_entry_timeout,
+            "attr_timeout": config.fuse_attr_timeout,
+        }
+        # Entries that are not backed by a file on disk (ghost files, new directories, etc.) share
+        # the same attributes save for the inode. Build them once up front, as llfuse state dicts.
+        self.entry_templates: dict[Literal["dir", "file"], dict[str, Any]] = {
+            "dir": self.make_entry_attributes(self.rose.stat("dir"), 0).__getstate__(),
+            "file": self.make_entry_attributes(self.rose.stat("file"), 0).__getstate__(),
         }
         # We cache some items for getattr and lookup for performance reasons--after a ls, getattr is
         # serially called for each item in the directory, and sequential 1k SQLite reads is quite
-        # slow in any universe. So whenever we have a readdir, we do a batch read and populate the
+        # slow in any universe. So whenever we have an opendir, we do a batch read and populate the
         # getattr and lookup caches. The cache is valid for only 2 seconds, which prevents stale
         # results from being read from it.
         #
@@ -1058,6 +1491,23 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         self.getattr_cache: cachetools.TTLCache[int, llfuse.EntryAttributes]
         self.lookup_cache: cachetools.TTLCache[tuple[int, bytes], llfuse.EntryAttributes]
         self.reset_getattr_caches()
+        # Shells, editors, and file managers probe for many files that don't exist (e.g.
+        # `.DS_Store`, `.git`, `folder.jpg`). Remember the lookups that failed with ENOENT for a
+        # short period, so that repeated probes are rejected without parsing the path and querying
+        # the read cache. Any write evicts the failed lookups, since it can create files.
+        self.negative_lookup_cache: cachetools.TTLCache[tuple[int, bytes], bool] = (
+            cachetools.TTLCache(maxsize=99999, ttl=2)
+        )
+        # Similarly, once we have listed a directory in opendir, we know which names can exist in
+        # it: lookups that follow a readdir for anything else can be rejected immediately. Parsing
+        # strips positions and added-at dates, so a name that was not listed can still resolve to a
+        # listed entry. We therefore store every parse variant of the listed names; see
+        # `_name_variants`.
+        #
+        # Map of directory inode -> set of name variants.
+        self.child_name_sets: cachetools.TTLCache[int, frozenset[str]] = cachetools.TTLCache(
+            maxsize=9999, ttl=2
+        )
         # We handle state for readdir calls here. Because programs invoke readdir multiple times
         # with offsets, we end up with many readdir calls for a single directory. However, we do not
         # want to actually invoke the logical Rose readdir call that many times. So we load it once
@@ -1098,140 +1548,213 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         )
 
     def reset_getattr_caches(self) -> None:
-        # When a write happens, clear these caches. These caches are very short-lived and intended
-        # to make readdir's subsequent getattrs more performant, so this is harmless.
+        # These caches are very short-lived and intended to make readdir's subsequent getattrs more
+        # performant, so starting them from empty is harmless.
         self.getattr_cache = cachetools.TTLCache(maxsize=99999, ttl=1)
         self.lookup_cache = cachetools.TTLCache(maxsize=99999, ttl=1)
 
-    def make_entry_attributes(self, attrs: dict[str, Any]) -> llfuse.EntryAttributes:
-        for k, v in self.default_attrs.items():
-            if k not in attrs:
-                attrs[k] = v
+    def invalidate_dir(self, parent_inode: int) -> None:
+        # When a write happens, evict the cached children of the directory that was written to,
+        # rather than throwing away everything that a recent readdir populated. Any other views that
+        # the write affects are left to the caches' short TTL. A write can also create files in
+        # other views, so all failed lookups and directory listings are forgotten.
+        self.negative_lookup_cache.clear()
+        self.child_name_sets.clear()
+        for key in [k for k in self.lookup_cache if k[0] == parent_inode]:
+            entry = self.lookup_cache.pop(key, None)
+            if entry is not None:
+                self.getattr_cache.pop(entry.st_ino, None)
+
+    def make_entry_attributes(self, attrs: StatAttrs, inode: int) -> llfuse.EntryAttributes:
         entry = llfuse.EntryAttributes()
-        for k, v in attrs.items():
+        for k, v in self.default_attrs.items():
             setattr(entry, k, v)
+        entry.st_mode = attrs.st_mode
+        entry.st_nlink = attrs.st_nlink
+        entry.st_uid = attrs.st_uid
+        entry.st_gid = attrs.st_gid
+        entry.st_size = attrs.st_size
+        entry.st_atime_ns = attrs.st_atime_ns
+        entry.st_mtime_ns = attrs.st_mtime_ns
+        entry.st_ctime_ns = attrs.st_ctime_ns
+        entry.st_ino = inode
+        return entry
+
+    def clone_entry_attributes(
+        self, mode: Literal["dir", "file"], inode: int
+    ) -> llfuse.EntryAttributes:
+        """
+        Build the entry attributes of a file or directory that isn't backed by a file on disk from
+        a prebuilt template, rather than building the stat and copying it over field by field.
+        """
+        entry = llfuse.EntryAttributes()
+        entry.__setstate__(self.entry_templates[mode])
+        entry.st_ino = inode
         return entry
 
     def getattr(self, inode: int, _: Any) -> llfuse.EntryAttributes:
-        logger.debug(f"FUSE: Received getattr for {inode=}")
+        logger.debug("FUSE: Received getattr for inode=%r", inode)
         # For performance, pull from the getattr cache if possible.
-        with contextlib.suppress(KeyError):
-            attrs = self.getattr_cache[inode]
-            logger.debug(f"FUSE: Resolved getattr for {inode=} to {attrs.__getstate__()=}")
-            return attrs
+        if (entry := self.getattr_cache.get(inode)) is not None:
+            # Serializing the attributes isn't free; skip it unless we'll actually log it.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "FUSE: Resolved getattr for inode=%r to entry=%r", inode, entry.__getstate__()
+                )
+            return entry
         spath = self.inodes.get_path(inode)
-        logger.debug(f"FUSE: Resolved getattr {inode=} to {spath=}")
-        # If this path is a ghost file path; pretend here!
-        if self.ghost_existing_files.get(str(spath), False):
-            logger.debug(f"FUSE: Resolved getattr for {spath=} as ghost existing file")
-            attrs = self.rose.stat("file")
-            attrs["st_ino"] = inode
-            return self.make_entry_attributes(attrs)
+        logger.debug("FUSE: Resolved getattr inode=%r to spath=%r", inode, spath)
+        # The root and the top-level view directories always have the default directory attributes,
+        # so skip parsing and dispatching for them.
+        if spath == "/" or spath[1:] in VIEW_DIRNAMES:
+            return self.clone_entry_attributes("dir", inode)
+        # If this path is a ghost file path; pretend here! The ghost caches are almost always empty,
+        # so check that before stringifying the path and querying them.
+        if self.ghost_existing_files and self.ghost_existing_files.get(spath, False):
+            logger.debug("FUSE: Resolved getattr for spath=%r as ghost existing file", spath)
+            return self.clone_entry_attributes("file", inode)
 
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed getattr {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed getattr spath=%r to vpath=%r", spath, vpath)
         try:
             attrs = self.rose.getattr(vpath)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        attrs["st_ino"] = inode
-        return self.make_entry_attributes(attrs)
+        return self.make_entry_attributes(attrs, inode)
 
     def lookup(self, parent_inode: int, name: bytes, _: Any) -> llfuse.EntryAttributes:
-        logger.debug(f"FUSE: Received lookup for {parent_inode=}/{name=}")
+        logger.debug("FUSE: Received lookup for parent_inode=%r/name=%r", parent_inode, name)
         # For performance, pull from the lookup cache if possible.
-        with contextlib.suppress(KeyError):
-            attrs = self.lookup_cache[(parent_inode, name)]
-            logger.debug(
-                f"FUSE: Resolved lookup {parent_inode=}/{name=} to {attrs.__getstate__()=}"
-            )
-            return attrs
+        if (entry := self.lookup_cache.get((parent_inode, name))) is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "FUSE: Resolved lookup parent_inode=%r/name=%r to entry=%r",
+                    parent_inode,
+                    name,
+                    entry.__getstate__(),
+                )
+            return entry
         spath = self.inodes.get_path(parent_inode, name)
         inode = self.inodes.calc_inode(spath)
-        logger.debug(f"FUSE: Resolved lookup {parent_inode=}/{name=} to {spath=}")
+        logger.debug(
+            "FUSE: Resolved lookup parent_inode=%r/name=%r to spath=%r", parent_inode, name, spath
+        )
         # If this path is a ghost file path; pretend here!
-        if self.ghost_existing_files.get(str(spath), False):
-            logger.debug(f"FUSE: Resolved getattr for {spath=} as ghost existing file")
-            attrs = self.rose.stat("file")
-            attrs["st_ino"] = inode
-            return self.make_entry_attributes(attrs)
+        if self.ghost_existing_files and self.ghost_existing_files.get(spath, False):
+            logger.debug("FUSE: Resolved getattr for spath=%r as ghost existing file", spath)
+            return self.clone_entry_attributes("file", inode)
         # If this directory is a ghost directory path; pretend here!
-        if self.ghost_writable_empty_directory.get(str(spath.parent), False):
-            logger.debug(f"FUSE: Resolved lookup for {spath=} as ghost writeable directory")
-            raise llfuse.FUSEError(errno.ENOENT)
+        if self.ghost_writable_empty_directory and self.ghost_writable_empty_directory.get(
+            os.path.dirname(spath), False
+        ):
+            logger.debug("FUSE: Resolved lookup for spath=%r as ghost writeable directory", spath)
+            raise ENOENT_ERROR.with_traceback(None)
+        if (parent_inode, name) in self.negative_lookup_cache:
+            logger.debug("FUSE: Resolved lookup for spath=%r from the negative lookup cache", spath)
+            raise ENOENT_ERROR.with_traceback(None)
+        if (children := self.child_name_sets.get(parent_inode)) is not None and children.isdisjoint(
+            _name_variants(os.path.basename(spath))
+        ):
+            logger.debug(
+                "FUSE: Resolved lookup for spath=%r as absent from its parent's readdir", spath
+            )
+            raise ENOENT_ERROR.with_traceback(None)
 
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed lookup {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed lookup spath=%r to vpath=%r", spath, vpath)
         try:
             attrs = self.rose.getattr(vpath)
         except OSError as e:
+            if e.errno == errno.ENOENT:
+                self.negative_lookup_cache[(parent_inode, name)] = True
             raise llfuse.FUSEError(e.errno) from e
-        attrs["st_ino"] = inode
-        return self.make_entry_attributes(attrs)
+        return self.make_entry_attributes(attrs, inode)
 
     def opendir(self, inode: int, _: Any) -> int:
-        logger.debug(f"FUSE: Received opendir for {inode=}")
+        logger.debug("FUSE: Received opendir for inode=%r", inode)
         spath = self.inodes.get_path(inode)
-        logger.debug(f"FUSE: Resolved opendir {inode=} to {spath=}")
+        logger.debug("FUSE: Resolved opendir inode=%r to spath=%r", inode, spath)
         # If this directory is a ghost directory path; pretend here!
-        if self.ghost_writable_empty_directory.get(str(spath), False):
-            logger.debug(f"FUSE: Resolved lookup for {spath=} as ghost writeable directory")
+        if self.ghost_writable_empty_directory and self.ghost_writable_empty_directory.get(
+            spath, False
+        ):
+            logger.debug("FUSE: Resolved lookup for spath=%r as ghost writeable directory", spath)
             entries: list[tuple[int, bytes, llfuse.EntryAttributes]] = []
             for node in [".", ".."]:
-                attrs = self.rose.stat("dir")
-                attrs["st_ino"] = self.inodes.calc_inode(spath / node)
-                entry = self.make_entry_attributes(attrs)
+                entry = self.clone_entry_attributes(
+                    "dir", self.inodes.calc_inode(_join_path(spath, node))
+                )
                 entries.append((inode, node.encode(), entry))
             fh = self.fhandler.next()
             self.readdir_cache[fh] = entries
             return fh
 
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed opendir {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed opendir spath=%r to vpath=%r", spath, vpath)
         entries = []
+        names: set[str] = set()
         try:
             for namestr, attrs in self.rose.readdir(vpath):
-                name = namestr.encode()
-                attrs["st_ino"] = self.inodes.calc_inode(spath / namestr)
-                entry = self.make_entry_attributes(attrs)
+                # Encode the names as the kernel will hand them back to lookup, so that the lookup
+                # cache entries populated here are hit.
+                name = namestr.encode("utf-8", "surrogateescape")
+                entry = self.make_entry_attributes(
+                    attrs, self.inodes.calc_inode(_join_path(spath, namestr))
+                )
                 entries.append((inode, name, entry))
+                names.update(_name_variants(namestr))
+                # Populate the getattr and lookup caches with the whole listing in this one pass,
+                # rather than as readdir hands out each entry. The kernel may call readdir several
+                # times per listing, and re-inserting there could also resurrect entries that a
+                # write evicted after the directory was opened. `.` and `..` are skipped: their
+                # attributes are placeholders, and they must not replace the real ones of the
+                # directory and its parent.
+                if namestr not in (".", ".."):
+                    self.getattr_cache[entry.st_ino] = entry
+                    self.lookup_cache[(inode, name)] = entry
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
+        self.child_name_sets[inode] = frozenset(names)
         fh = self.fhandler.next()
         self.readdir_cache[fh] = entries
-        logger.debug(f"FUSE: Stored {len(entries)=} nodes into the readdir cache for {fh=}")
+        logger.debug(
+            "FUSE: Stored len(entries)=%r nodes into the readdir cache for fh=%r", len(entries), fh
+        )
         return fh
 
     def releasedir(self, fh: int) -> None:
-        with contextlib.suppress(KeyError):
-            del self.readdir_cache[fh]
+        if self.readdir_cache.pop(fh, None) is not None:
+            self.fhandler.release(fh)
 
     def readdir(
         self,
         fd: int,
         offset: int = 0,
     ) -> Iterator[tuple[bytes, llfuse.EntryAttributes, int]]:
-        logger.debug(f"FUSE: Received readdir for {fd=} {offset=}")
+        logger.debug("FUSE: Received readdir for fd=%r offset=%r", fd, offset)
         try:
             entries = self.readdir_cache[fd]
         except KeyError:
             return
-        for i, (parent_inode, name, entry) in enumerate(entries[offset:]):
-            self.getattr_cache[entry.st_ino] = entry
-            self.lookup_cache[(parent_inode, name)] = entry
-            yield name, entry, i + offset + 1
-            logger.debug(f"FUSE: Yielded entry {i + offset=} in readdir of {fd=}")
+        # Index into the entries rather than slicing them, so that resuming a large directory at an
+        # offset does not copy its tail.
+        for i in range(offset, len(entries)):
+            _, name, entry = entries[i]
+            yield name, entry, i + 1
+            logger.debug("FUSE: Yielded entry i=%r in readdir of fd=%r", i, fd)
 
     def open(self, inode: int, flags: int, _: Any) -> int:
-        logger.debug(f"FUSE: Received open for {inode=} {flags=}")
+        logger.debug("FUSE: Received open for inode=%r flags=%r", inode, flags)
         spath = self.inodes.get_path(inode)
-        logger.debug(f"FUSE: Resolved open {inode=} to {spath=}")
-        if self.ghost_writable_empty_directory.get(str(spath.parent), False):
-            logger.debug(f"FUSE: Resolved open for {spath=} as ghost writeable directory")
-            self.ghost_existing_files[str(spath)] = True
+        logger.debug("FUSE: Resolved open inode=%r to spath=%r", inode, spath)
+        if self.ghost_writable_empty_directory and self.ghost_writable_empty_directory.get(
+            os.path.dirname(spath), False
+        ):
+            logger.debug("FUSE: Resolved open for spath=%r as ghost writeable directory", spath)
+            self.ghost_existing_files[spath] = True
             return self.fhandler.dev_null
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed open {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed open spath=%r to vpath=%r", spath, vpath)
         try:
             fh = self.rose.open(vpath, flags)
         except OSError as e:
@@ -1239,14 +1762,14 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         # If this was a create operation, and Rose succeeded, flag the filepath as a ghost file and
         # _always_ pretend it exists for the following short duration.
         if flags & os.O_CREAT == os.O_CREAT:
-            logger.debug(f"FUSE: Setting {spath=} as ghost existing file for next 3 seconds")
-            self.ghost_existing_files[str(spath)] = True
+            logger.debug("FUSE: Setting spath=%r as ghost existing file for next 3 seconds", spath)
+            self.ghost_existing_files[spath] = True
         return fh
 
     def read(self, fh: int, offset: int, length: int) -> bytes:
-        logger.debug(f"FUSE: Received read for {fh=} {offset=} {length=}")
+        logger.debug("FUSE: Received read for fh=%r offset=%r length=%r", fh, offset, length)
         if fh == self.fhandler.dev_null:
-            logger.debug(f"FUSE: Matched {fh=} to /dev/null sentinel")
+            logger.debug("FUSE: Matched fh=%r to /dev/null sentinel", fh)
             return b""
         try:
             return self.rose.read(fh, offset, length)
@@ -1254,9 +1777,9 @@ class VirtualFS(llfuse.Operations):  # type: ignore
             raise llfuse.FUSEError(e.errno) from e
 
     def write(self, fh: int, offset: int, data: bytes) -> int:
-        logger.debug(f"FUSE: Received write for {fh=} {offset=} {len(data)=}")
+        logger.debug("FUSE: Received write for fh=%r offset=%r len(data)=%r", fh, offset, len(data))
         if fh == self.fhandler.dev_null:
-            logger.debug(f"FUSE: Matched {fh=} to /dev/null sentinel")
+            logger.debug("FUSE: Matched fh=%r to /dev/null sentinel", fh)
             return len(data)
         try:
             return self.rose.write(fh, offset, data)
@@ -1264,19 +1787,22 @@ class VirtualFS(llfuse.Operations):  # type: ignore
             raise llfuse.FUSEError(e.errno) from e
 
     def release(self, fh: int) -> None:
-        logger.debug(f"FUSE: Received release for {fh=}")
+        logger.debug("FUSE: Received release for fh=%r", fh)
         if fh == self.fhandler.dev_null:
-            logger.debug(f"FUSE: Matched {fh=} to /dev/null sentinel")
+            logger.debug("FUSE: Matched fh=%r to /dev/null sentinel", fh)
             return
+        # Releasing a file can create files, e.g. the cover art of a new-cover-art sequence.
+        self.negative_lookup_cache.clear()
+        self.child_name_sets.clear()
         try:
             self.rose.release(fh)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
 
     def ftruncate(self, fh: int, length: int = 0) -> None:
-        logger.debug(f"FUSE: Received ftruncate for {fh=} {length=}")
+        logger.debug("FUSE: Received ftruncate for fh=%r length=%r", fh, length)
         if fh == self.fhandler.dev_null:
-            logger.debug(f"FUSE: Matched {fh=} to /dev/null sentinel")
+            logger.debug("FUSE: Matched fh=%r to /dev/null sentinel", fh)
             return
         fh = self.fhandler.unwrap_host(fh)
         return os.ftruncate(fh, length)
@@ -1289,65 +1815,75 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         flags: int,
         ctx: Any,
     ) -> tuple[int, llfuse.EntryAttributes]:
-        logger.debug(f"FUSE: Received create for {parent_inode=}/{name=} {flags=}")
+        logger.debug(
+            "FUSE: Received create for parent_inode=%r/name=%r flags=%r", parent_inode, name, flags
+        )
         path = self.inodes.get_path(parent_inode, name)
-        logger.debug(f"FUSE: Resolved create {parent_inode=}/{name=} to {path=}")
+        logger.debug(
+            "FUSE: Resolved create parent_inode=%r/name=%r to path=%r", parent_inode, name, path
+        )
         inode = self.inodes.calc_inode(path)
-        logger.debug(f"FUSE: Created inode {inode=} for {path=}; now delegating to open call")
+        logger.debug(
+            "FUSE: Created inode inode=%r for path=%r; now delegating to open call", inode, path
+        )
         try:
             fh = self.open(inode, flags, ctx)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        self.reset_getattr_caches()
-        attrs = self.rose.stat("file")
-        attrs["st_ino"] = inode
-        return fh, self.make_entry_attributes(attrs)
+        self.invalidate_dir(parent_inode)
+        return fh, self.clone_entry_attributes("file", inode)
 
     def unlink(self, parent_inode: int, name: bytes, _: Any) -> None:
-        logger.debug(f"FUSE: Received unlink for {parent_inode=}/{name=}")
+        logger.debug("FUSE: Received unlink for parent_inode=%r/name=%r", parent_inode, name)
         spath = self.inodes.get_path(parent_inode, name)
-        logger.debug(f"FUSE: Resolved unlink {parent_inode=}/{name=} to {spath=}")
+        logger.debug(
+            "FUSE: Resolved unlink parent_inode=%r/name=%r to spath=%r", parent_inode, name, spath
+        )
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed unlink {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed unlink spath=%r to vpath=%r", spath, vpath)
         try:
             self.rose.unlink(vpath)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        self.reset_getattr_caches()
+        self.invalidate_dir(parent_inode)
         self.inodes.remove_path(spath)
 
     def mkdir(self, parent_inode: int, name: bytes, _mode: int, _: Any) -> llfuse.EntryAttributes:
-        logger.debug(f"FUSE: Received mkdir for {parent_inode=}/{name=}")
+        logger.debug("FUSE: Received mkdir for parent_inode=%r/name=%r", parent_inode, name)
         spath = self.inodes.get_path(parent_inode, name)
-        logger.debug(f"FUSE: Resolved mkdir {parent_inode=}/{name=} to {spath=}")
+        logger.debug(
+            "FUSE: Resolved mkdir parent_inode=%r/name=%r to spath=%r", parent_inode, name, spath
+        )
         vpath = VirtualPath.parse(spath, parse_release_position=False)
-        logger.debug(f"FUSE: Parsed mkdir {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed mkdir spath=%r to vpath=%r", spath, vpath)
         try:
             self.rose.mkdir(vpath)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        self.reset_getattr_caches()
+        self.invalidate_dir(parent_inode)
         inode = self.inodes.calc_inode(spath)
         # If this was an add to collage operation, then flag the directory as a ghost writeable
         # directory for the following short duration.
         if vpath.collage:
-            logger.debug(f"FUSE: Setting {spath=} as ghost writeable directory for next 3 seconds")
-            self.ghost_writable_empty_directory[str(spath)] = True
-        attrs = self.rose.stat("dir")
-        attrs["st_ino"] = inode
-        return self.make_entry_attributes(attrs)
+            logger.debug(
+                "FUSE: Setting spath=%r as ghost writeable directory for next 3 seconds", spath
+            )
+            self.ghost_writable_empty_directory[spath] = True
+        return self.clone_entry_attributes("dir", inode)
 
     def rmdir(self, parent_inode: int, name: bytes, _: Any) -> None:
-        logger.debug(f"FUSE: Received rmdir for {parent_inode=}/{name=}")
+        logger.debug("FUSE: Received rmdir for parent_inode=%r/name=%r", parent_inode, name)
         spath = self.inodes.get_path(parent_inode, name)
-        logger.debug(f"FUSE: Resolved rmdir {parent_inode=}/{name=} to {spath=}")
+        logger.debug(
+            "FUSE: Resolved rmdir parent_inode=%r/name=%r to spath=%r", parent_inode, name, spath
+        )
         vpath = VirtualPath.parse(spath)
-        logger.debug(f"FUSE: Parsed rmdir {spath=} to {vpath=}")
+        logger.debug("FUSE: Parsed rmdir spath=%r to vpath=%r", spath, vpath)
         try:
             self.rose.rmdir(vpath)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        self.reset_getattr_caches()
+        self.invalidate_dir(parent_inode)
         self.inodes.remove_path(spath)
 
     def rename(
@@ -1359,25 +1895,40 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         _: Any,
     ) -> None:
         logger.debug(
-            f"FUSE: Received rename for {old_parent_inode=}/{old_name=} "
-            f"to {new_parent_inode=}/{new_name=}"
+            "FUSE: Received rename for old_parent_inode=%r/old_name=%r "
+            "to new_parent_inode=%r/new_name=%r",
+            old_parent_inode,
+            old_name,
+            new_parent_inode,
+            new_name,
         )
         old_spath = self.inodes.get_path(old_parent_inode, old_name)
         new_spath = self.inodes.get_path(new_parent_inode, new_name)
         logger.debug(
-            f"FUSE: Received rename for {old_parent_inode=}/{old_name=} to {old_spath=}"
-            f"and for {new_parent_inode=}/{new_name=} to {new_spath=}"
+            "FUSE: Resolved rename for old_parent_inode=%r/old_name=%r to old_spath=%r "
+            "and for new_parent_inode=%r/new_name=%r to new_spath=%r",
+            old_parent_inode,
+            old_name,
+            old_spath,
+            new_parent_inode,
+            new_name,
+            new_spath,
         )
         old_vpath = VirtualPath.parse(old_spath)
         new_vpath = VirtualPath.parse(new_spath)
         logger.debug(
-            f"FUSE: Parsed rmdir {old_spath=} to {old_vpath=} and {old_vpath=} to {new_vpath=}"
+            "FUSE: Parsed rename old_spath=%r to old_vpath=%r and new_spath=%r to new_vpath=%r",
+            old_spath,
+            old_vpath,
+            new_spath,
+            new_vpath,
         )
         try:
             self.rose.rename(old_vpath, new_vpath)
         except OSError as e:
             raise llfuse.FUSEError(e.errno) from e
-        self.reset_getattr_caches()
+        self.invalidate_dir(old_parent_inode)
+        self.invalidate_dir(new_parent_inode)
         self.inodes.rename_path(old_spath, new_spath)
 
     # ============================================================================================
@@ -1386,18 +1937,18 @@ class VirtualFS(llfuse.Operations):  # type: ignore
     # ============================================================================================
 
     def forget(self, inode_list: list[tuple[int, int]]) -> None:
-        logger.debug(f"FUSE: Received forget for {inode_list=}")
-        # Clear the cache in case someone makes a request later...
-        self.reset_getattr_caches()
+        logger.debug("FUSE: Received forget for inode_list=%r", inode_list)
+        # Evict the forgotten inodes from the cache in case someone makes a request later...
+        for inode, _ in inode_list:
+            self.getattr_cache.pop(inode, None)
 
     def mknod(self, parent_inode: int, name: bytes, _mode: int, _: Any) -> llfuse.EntryAttributes:
-        logger.debug(f"FUSE: Received mknod for {parent_inode=}/{name=}")
-        attrs = self.rose.stat("file")
-        attrs["st_ino"] = self.inodes.calc_inode(self.inodes.get_path(parent_inode, name))
-        return self.make_entry_attributes(attrs)
+        logger.debug("FUSE: Received mknod for parent_inode=%r/name=%r", parent_inode, name)
+        inode = self.inodes.calc_inode(self.inodes.get_path(parent_inode, name))
+        return self.clone_entry_attributes("file", inode)
 
     def flush(self, fh: int) -> None:
-        logger.debug(f"FUSE: Received flush for {fh=}")
+        logger.debug("FUSE: Received flush for fh=%r", fh)
         pass
 
     def setattr(
@@ -1408,38 +1959,78 @@ class VirtualFS(llfuse.Operations):  # type: ignore
         fh: int | None,
         ctx: Any,
     ) -> llfuse.EntryAttributes:
-        logger.debug(f"FUSE: Received setattr for {inode=} {attr=} {fields=} {fh=}")
+        logger.debug(
+            "FUSE: Received setattr for inode=%r attr=%r fields=%r fh=%r", inode, attr, fields, fh
+        )
         return self.getattr(inode, ctx)
 
+    # We don't support extended attributes. Rather than answer every xattr request with "no such
+    # attribute" (`ls -l` alone asks once per file), reply ENOSYS: the kernel then remembers that
+    # the filesystem doesn't implement the call and stops sending it to us for the rest of the
+    # mount.
+
     def getxattr(self, inode: int, name: bytes, _: Any) -> bytes:
-        logger.debug(f"FUSE: Received getxattr for {inode=} {name=}")
-        raise llfuse.FUSEError(llfuse.ENOATTR)
+        logger.debug("FUSE: Received getxattr for inode=%r name=%r", inode, name)
+        raise llfuse.FUSEError(errno.ENOSYS)
 
     def setxattr(self, inode: int, name: bytes, value: bytes, _: Any) -> None:
-        logger.debug(f"FUSE: Received setxattr for {inode=} {name=} {value=}")
+        logger.debug("FUSE: Received setxattr for inode=%r name=%r value=%r", inode, name, value)
 
     def listxattr(self, inode: int, _: Any) -> Iterator[bytes]:
-        logger.debug(f"FUSE: Received listxattr for {inode=}")
-        return iter([])
+        logger.debug("FUSE: Received listxattr for inode=%r", inode)
+        raise llfuse.FUSEError(errno.ENOSYS)
 
     def removexattr(self, inode: int, name: bytes, _: Any) -> None:
-        logger.debug(f"FUSE: Received removexattr for {inode=} {name=}")
-        raise llfuse.FUSEError(llfuse.ENOATTR)
+        logger.debug("FUSE: Received removexattr for inode=%r name=%r", inode, name)
+        raise llfuse.FUSEError(errno.ENOSYS)
 
 
 def mount_virtualfs(c: Config, debug: bool = False) -> None:
     options = set(llfuse.default_options)
     options.add("fsname=rose")
+    # Let the kernel send writes larger than a page, and ask for the largest write size. libfuse
+    # clamps max_write to the size of its request buffer, so this takes the biggest chunks that the
+    # library can handle. This cuts down on the number of write round trips when copying files into
+    # the virtual filesystem.
+    options.add("big_writes")
+    options.add(f"max_write={1 << 20}")
+    # Have libfuse splice replies into /dev/fuse instead of copying them. Our read handler returns
+    # the bytes to llfuse, so the kernel cannot splice straight from the host file; this is the
+    # part of the reply path that can skip a copy. Splicing requests out of /dev/fuse is left off:
+    # llfuse has no write_buf handler, so libfuse would have to copy spliced writes back out.
+    options.add("splice_write")
+    options.add("splice_move")
+    options.add("no_splice_read")
     if debug:
         options.add("debug")
     llfuse.init(VirtualFS(c), str(c.fuse_mount_dir), options)
     try:
-        llfuse.main(workers=c.max_proc)
+        llfuse.main(workers=c.fuse_workers)
     except:
         llfuse.close()
         raise
+    finally:
+        # The parsed paths are only useful while the filesystem is mounted.
+        PARSE_CACHE.clear()
     llfuse.close()
 
 
+def _load_umount2() -> Any:
+    """Return umount2(2) from libc, or None where libc lacks it (e.g. macOS)."""
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).umount2
+    except (AttributeError, OSError):
+        return None
+    fn.argtypes = [ctypes.c_char_p, ctypes.c_int]
+    return fn
+
+
+UMOUNT2: Final[Any] = _load_umount2()
+
+
 def unmount_virtualfs(c: Config) -> None:
+    # Unmount with the syscall where we can, rather than forking and executing umount. Only
+    # privileged users may unmount directly; otherwise, umount(8) hands off to fusermount.
+    if UMOUNT2 is not None and UMOUNT2(os.fsencode(c.fuse_mount_dir), 0) == 0:
+        return
     subprocess.run(["umount", str(c.fuse_mount_dir)])
@@ -1,3 +1,4 @@
+import os
 import shutil
 import subprocess
 import time
@@ -7,12 +8,13 @@ from dataclasses import asdict
 from multiprocessing import Process
 from pathlib import Path
 
+import llfuse
 import pytest
 
 from conftest import retry_for_sec
 from rose.audiotags import AudioTags
 from rose.config import Config
-from rose.virtualfs import mount_virtualfs, unmount_virtualfs
+from rose.virtualfs import FileHandleManager, INodeManager, mount_virtualfs, unmount_virtualfs
 
 
 @contextmanager
@@ -111,6 +113,17 @@ def test_virtual_filesystem_reads(config: Config) -> None:
         assert can_read(root / "8. Playlists" / "Lala Lisa" / "cover.jpg")
 
 
+@pytest.mark.usefixtures("seeded_cache")
+def test_virtual_filesystem_reads_at_offsets(config: Config) -> None:
+    """Reads are positional, so out-of-order reads on one handle each see their own offset."""
+    data = bytes(range(256)) * 1024
+    (config.music_source_dir / "r1" / "01.m4a").write_bytes(data)
+    root = config.fuse_mount_dir
+    with start_virtual_fs(config), (root / "1. Releases" / "r1" / "01. 01.m4a").open("rb") as fp:
+        for offset in [200_000, 0, 131_072, 7]:
+            assert os.pread(fp.fileno(), 4096, offset) == data[offset : offset + 4096]
+
+
 def test_virtual_filesystem_write_files(
     config: Config,
     source_dir: Path,  # noqa: ARG001
@@ -334,6 +347,33 @@ def test_virtual_filesystem_playlist_cover_art_actions(
                 break
 
 
+def test_virtual_filesystem_lookup_after_create(
+    config: Config,
+    source_dir: Path,  # noqa: ARG001
+) -> None:
+    """Test that failed lookups are forgotten once the missing name is created."""
+    root = config.fuse_mount_dir
+    release_dir = root / "1. Releases" / "{NEW} BLACKPINK - 1990. I Love Blackpink [K-Pop;Pop]"
+    with start_virtual_fs(config):
+        # List the directories first, so that lookups are also checked against their listings.
+        assert "Cherry Red" not in [f.name for f in (root / "7. Collages").iterdir()]
+        assert not (root / "7. Collages" / "Cherry Red").exists()
+        (root / "7. Collages" / "Cherry Red").mkdir()
+        for _ in retry_for_sec(0.2):
+            if (root / "7. Collages" / "Cherry Red").is_dir():
+                break
+        assert (root / "7. Collages" / "Cherry Red").is_dir()
+
+        assert "cover.jpg" not in [f.name for f in release_dir.iterdir()]
+        assert not (release_dir / "cover.jpg").exists()
+        with (release_dir / "folder.jpg").open("w") as fp:
+            fp.write("hi")
+        for _ in retry_for_sec(0.2):
+            if (release_dir / "cover.jpg").is_file():
+                break
+        assert (release_dir / "cover.jpg").is_file()
+
+
 def test_virtual_filesystem_delete_release(config: Config, source_dir: Path) -> None:
     dirname = "NewJeans - 1990. I Love NewJeans [K-Pop;R&B]"
     root = config.fuse_mount_dir
@@ -422,3 +462,71 @@ def test_virtual_filesystem_whitelist(config: Config) -> None:
         assert (root / "4. Artists" / "Bass Man").is_dir()
         assert (root / "5. Genres" / "Techno").is_dir()
         assert (root / "6. Labels" / "Silk Music").is_dir()
+
+
+def test_file_handle_manager_wraps() -> None:
+    fhandler = FileHandleManager()
+    handles = []
+    for _ in range(20_000):
+        handles.append(fhandler.next())
+        fhandler.release(handles[-1])
+    assert min(handles) == 10
+    assert max(handles) == 9_999
+    assert fhandler.dev_null not in handles
+
+
+def test_file_handle_manager_wrap_skips_live_handles() -> None:
+    fhandler = FileHandleManager()
+    live = fhandler.next()
+    # Cycle the counter past the live handle: it must not be handed out again until released.
+    handles = []
+    for _ in range(10_000):
+        handles.append(fhandler.next())
+        fhandler.release(handles[-1])
+    assert live not in handles
+    fhandler.release(live)
+    for _ in range(10_000):
+        handles.append(fhandler.next())
+        fhandler.release(handles[-1])
+    assert live in handles
+
+
+def test_file_handle_manager_exhausted() -> None:
+    fhandler = FileHandleManager()
+    for _ in range(10_000 - 10):
+        fhandler.next()
+    with pytest.raises(llfuse.FUSEError):
+        fhandler.next()
+
+
+def test_file_handle_manager_release_host() -> None:
+    fhandler = FileHandleManager()
+    fh = fhandler.wrap_host(3)
+    assert fhandler.unwrap_host(fh) == 3
+    assert fhandler.release_host(fh) == 3
+    with pytest.raises(llfuse.FUSEError):
+        fhandler.unwrap_host(fh)
+
+
+def test_file_handle_manager_wrap_skips_open_host_handles() -> None:
+    fhandler = FileHandleManager()
+    fh = fhandler.wrap_host(3)
+    # Cycle the counter until it is about to hand out the open handle again, then wrap more host
+    # handles across it.
+    for _ in range(9_989):
+        fhandler.release(fhandler.next())
+    others = [fhandler.wrap_host(4) for _ in range(11)]
+    assert fh not in others
+    assert fhandler.unwrap_host(fh) == 3
+
+
+def test_inode_manager_stable_inodes(config: Config) -> None:
+    inodes = INodeManager(config)
+    inode = inodes.calc_inode("/1. Releases/r1")
+    assert inode != llfuse.ROOT_INODE
+    assert inodes.get_path(inode) == "/1. Releases/r1"
+    assert inodes.calc_inode("/1. Releases/r2") != inode
+    # A fresh manager, as after a remount, derives the same inode for the same path.
+    remounted = INodeManager(config)
+    assert remounted.calc_inode("/1. Releases/r1") == inode
+    assert remounted.get_path(inode) == "/1. Releases/r1"